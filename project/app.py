@@ -1,79 +1,207 @@
+import argparse
+from typing import List, Optional, Tuple
+
 from model.components import MonitoringSystem, Facility, HoldingArea, Container
-from model.components import Builder, Commander
-
-
-# Create model with Builder by loading data from a JSON file
-builder = Builder()
-# model = builder.load_dummy_model()
-model = builder.load_model_from_file("../data/dummy_model.json")
-
-# Get container and holding area from registry
-container_1: Container = MonitoringSystem.get_instance(id=3)
-holding_area_origin: HoldingArea = (
-    container_1.get_location().get_holding_area()
-)
-holding_area_destination: HoldingArea = MonitoringSystem.get_instance(id=10)
-
-# Move container by sending Transport sepecifications to Commander
-target = container_1
-origin = container_1.get_location()
-destination = holding_area_destination.get_location()
-destination.set_holding_area(holding_area_destination)
-start_time = "2024:04:04.09:42"
-end_time = "2024:04:04.11:08"
-
-commander = Commander()
-commander.issue_transport_command(
-    target, origin, destination, start_time, end_time
-)
-
-# Move container back to origin afterwards
-start_time2 = "2024:08:06.13:12"
-end_time2 = "2024:08:06.14:19"
-commander.issue_transport_command(
-    target, destination, origin, start_time2, end_time2
-)
-
-# Print Holding area instance histories
-print("Current Instance History - Holding area origin")
-print(holding_area_origin.get_instance_history())
-
-print("Initial Instance History - Holding area origin")
-print(holding_area_origin.get_instance_history().at_time("2024:05:01.00:00"))
-
-print("Intermediate Instance History - Holding area origin")
-print(holding_area_origin.get_instance_history().at_time("2024:01:01.00:00"))
-
-
-print("Current Instance History - Holding area destination")
-print(holding_area_destination.get_instance_history())
-
-print("Intermediate Instance History - Holding area destination")
-print(
-    holding_area_destination.get_instance_history().at_time("2024:05:01.00:00")
-)
-print("Initial Instance History - Holding area destination")
-print(
-    holding_area_destination.get_instance_history().at_time("2024:01:01.00:00")
-)
-
-# Print facility complete histories
-facility_origin: Facility = origin.get_facility()
-print("Current Complete History - Facility origin")
-print(facility_origin.get_complete_history())
-
-facility_destination: Facility = destination.get_facility()
-print("Current Complete History - Facility destination")
-print(facility_destination.get_complete_history())
-
-# Export current state of model to a JSON file
-builder.export_model_state("../data/dummy_model_export.json")
-
-# Print History with ongoing commands at specific time
-time = "2024:08:06.13:13"
-print(f"Ongoing commands at time {time}")
-print(MonitoringSystem.get_ongoing_commands_at_time(time))
-
-# Export state of model at specific time to a JSON file
-time2 = "2024:05:01.00:00"
-builder.export_model_state("../data/dummy_model_at_time_export.json", time2)
+from model.components import Builder, Commander, Location
+
+
+MODEL_FILE = "../data/dummy_model.json"
+EXPORT_FILE = "../data/dummy_model_export.json"
+EXPORT_AT_TIME_FILE = "../data/dummy_model_at_time_export.json"
+
+
+def load_model(file_path: str = MODEL_FILE) -> Builder:
+    """
+    Creates model with Builder by loading data from a JSON file.
+
+    Args:
+        file_path (str): Relative or absolute path to json file.
+
+    Returns:
+        Builder: Builder instance that constructed the model.
+    """
+    builder = Builder()
+    builder.load_model_from_file(file_path)
+    return builder
+
+
+def scenario_transport(
+    src_id: int = 3,
+    dst_id: int = 10,
+    start_time: str = "2024:04:04.09:42",
+    end_time: str = "2024:04:04.11:08",
+) -> Tuple[Container, Location, Location]:
+    """
+    Moves a container to a holding area by sending Transport
+    specifications to Commander.
+
+    Args:
+        src_id (int): ID of container to be moved.
+        dst_id (int): ID of destination holding area.
+        start_time (str): Start time in the format YYYY:MM:DD.hh:mm.
+        end_time (str): End time in the format YYYY:MM:DD.hh:mm.
+
+    Returns:
+        Tuple[Container, Location, Location]:
+            Moved container, origin and destination of transport.
+    """
+    # Get container and holding area from registry
+    container: Container = MonitoringSystem.get_instance(id=src_id)
+    holding_area_destination: HoldingArea = MonitoringSystem.get_instance(
+        id=dst_id
+    )
+
+    origin = container.get_location()
+    destination = holding_area_destination.get_location()
+    destination.set_holding_area(holding_area_destination)
+
+    commander = Commander()
+    commander.issue_transport_command(
+        container, origin, destination, start_time, end_time
+    )
+    return container, origin, destination
+
+
+def scenario_transport_back(
+    container: Container,
+    origin: Location,
+    destination: Location,
+    start_time: str = "2024:08:06.13:12",
+    end_time: str = "2024:08:06.14:19",
+) -> None:
+    """
+    Moves a container back to the origin of a previous transport.
+
+    Args:
+        container (Container): Container to be moved back.
+        origin (Location): Origin of previous transport.
+        destination (Location): Destination of previous transport.
+        start_time (str): Start time in the format YYYY:MM:DD.hh:mm.
+        end_time (str): End time in the format YYYY:MM:DD.hh:mm.
+    """
+    commander = Commander()
+    commander.issue_transport_command(
+        container, destination, origin, start_time, end_time
+    )
+
+
+def print_histories(origin: Location, destination: Location) -> None:
+    """
+    Prints instance histories of holding areas and complete histories
+    of facilities at origin and destination of transport.
+
+    Args:
+        origin (Location): Origin of transport.
+        destination (Location): Destination of transport.
+    """
+    # Print Holding area instance histories, slicing each history
+    # at both times in one pass
+    history_origin = origin.get_holding_area().get_instance_history()
+    intermediate, initial = history_origin.at_times(
+        ["2024:05:01.00:00", "2024:01:01.00:00"]
+    )
+    print("Current Instance History - Holding area origin")
+    print(history_origin)
+
+    print("Intermediate Instance History - Holding area origin")
+    print(intermediate)
+
+    print("Initial Instance History - Holding area origin")
+    print(initial)
+
+    history_destination = destination.get_holding_area().get_instance_history()
+    intermediate, initial = history_destination.at_times(
+        ["2024:05:01.00:00", "2024:01:01.00:00"]
+    )
+    print("Current Instance History - Holding area destination")
+    print(history_destination)
+
+    print("Intermediate Instance History - Holding area destination")
+    print(intermediate)
+
+    print("Initial Instance History - Holding area destination")
+    print(initial)
+
+    # Print facility complete histories
+    facility_origin: Facility = origin.get_facility()
+    print("Current Complete History - Facility origin")
+    print(facility_origin.get_complete_history())
+
+    facility_destination: Facility = destination.get_facility()
+    print("Current Complete History - Facility destination")
+    print(facility_destination.get_complete_history())
+
+
+def print_ongoing_commands(time: str) -> None:
+    """
+    Prints History with ongoing commands at specific time.
+
+    Args:
+        time (str): Time in the format YYYY:MM:DD.hh:mm.
+    """
+    print(f"Ongoing commands at time {time}")
+    print(MonitoringSystem.get_ongoing_commands_at_time(time))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Loads the model once and dispatches to the requested scenario.
+    Without a subcommand, all scenarios are run in sequence.
+
+    Args:
+        argv (List[str], optional):
+            Command line arguments (default is 'None').
+    """
+    parser = argparse.ArgumentParser(
+        description="Run DT4Safeguards transport scenarios."
+    )
+    parser.add_argument(
+        "--model", default=MODEL_FILE, help="JSON file with model data."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("move", help="Move container to destination.")
+    subparsers.add_parser(
+        "move-back", help="Move container to destination and back."
+    )
+    subparsers.add_parser(
+        "print-history", help="Move container and print histories."
+    )
+    export_parser = subparsers.add_parser(
+        "export-at-time", help="Move container and export model state."
+    )
+    export_parser.add_argument(
+        "--time",
+        default="2024:05:01.00:00",
+        help="Time in the format YYYY:MM:DD.hh:mm.",
+    )
+    args = parser.parse_args(argv)
+
+    # Create model with Builder by loading data from a JSON file
+    builder = load_model(args.model)
+
+    # Move container to destination
+    container, origin, destination = scenario_transport()
+    if args.command == "move":
+        return
+
+    # Move container back to origin afterwards
+    scenario_transport_back(container, origin, destination)
+    if args.command == "move-back":
+        return
+
+    if args.command in (None, "print-history"):
+        print_histories(origin, destination)
+
+    if args.command is None:
+        # Export current state of model to a JSON file
+        builder.export_model_state(EXPORT_FILE)
+        print_ongoing_commands("2024:08:06.13:13")
+
+    if args.command in (None, "export-at-time"):
+        # Export state of model at specific time to a JSON file
+        time = getattr(args, "time", "2024:05:01.00:00")
+        builder.export_model_state(EXPORT_AT_TIME_FILE, time)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,350 @@
 from dataclasses import dataclass, field
-from typing import ClassVar, Dict, Optional
+from types import MappingProxyType
+from typing import (
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 from abc import abstractmethod
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-from contextlib import contextmanager
 from copy import copy
+from functools import lru_cache
+from operator import itemgetter
 from warnings import warn
 import json
+import os
+import re
+import sys
 
 from model.units import Dimensions, Position
 
+# Use faster JSON decoder if available
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+
+# Sentinel for missing dictionary entries
+_MISSING = object()
+
+# Read-only empty mapping for optional model dictionary entries
+_EMPTY_MAPPING: Mapping = MappingProxyType({})
+
+# Token that Commander passes to authorize activations
+_AUTHORIZATION_TOKEN = object()
+
+# Getters of dimensions and position values in model dictionaries
+_get_dimensions = itemgetter("dx", "dy", "dz")
+_get_position = itemgetter("x", "y", "z")
+
+# Pattern of time strings in the format YYYY:MM:DD.hh:mm, accepting
+# unpadded fields like strptime does
+_TIME_PATTERN = re.compile(r"(\d{4}):(\d{1,2}):(\d{1,2})\.(\d{1,2}):(\d{1,2})")
+
+
+@lru_cache(maxsize=1024)
+def _parse_time(time: str) -> datetime:
+    """
+    Parses a time string with the precompiled time pattern.
+    Results are cached since the same time stamps are compared
+    repeatedly when histories are filtered and sorted.
+
+    Args:
+        time (str): Time in the format YYYY:MM:DD.hh:mm.
+
+    Returns:
+        datetime: Parsed time.
+
+    Raises:
+        ValueError: If time does not match the format YYYY:MM:DD.hh:mm.
+    """
+    match = _TIME_PATTERN.fullmatch(time)
+    if match is None:
+        raise ValueError(
+            f"Time '{time}' does not match format YYYY:MM:DD.hh:mm."
+        )
+    return datetime(*map(int, match.groups()))
+
+
+def _json_loads(data: bytes) -> object:
+    """
+    Decodes JSON data with orjson if installed and with the json
+    module otherwise. Data rejected by orjson, like the NaN and
+    Infinity values accepted by json, is decoded again with json,
+    so that a model file loads the same with either decoder.
+
+    Args:
+        data (bytes): JSON data.
+
+    Returns:
+        object: Decoded data.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON.
+    """
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(data)
+        except json.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _dimensions_to_dict(dimensions: Dimensions) -> Dict[str, float]:
+    """
+    Converts dimensions into the dictionary format of model files.
+
+    Args:
+        dimensions (Dimensions): Dimensions to be converted.
+
+    Returns:
+        Dict[str, float]: Lengths in x, y and z direction.
+    """
+    return {
+        "dx": dimensions.get_x(),
+        "dy": dimensions.get_y(),
+        "dz": dimensions.get_z(),
+    }
+
+
+def _position_to_dict(position: Position) -> Dict[str, float]:
+    """
+    Converts a position into the dictionary format of model files.
+
+    Args:
+        position (Position): Position to be converted.
+
+    Returns:
+        Dict[str, float]: x, y and z coordinates.
+    """
+    return {
+        "x": position.get_x(),
+        "y": position.get_y(),
+        "z": position.get_z(),
+    }
+
+
+def _container_to_dict(container: "Container") -> Dict[str, object]:
+    """
+    Converts a container into the dictionary format of model files.
+
+    Args:
+        container (Container): Container to be converted.
+
+    Returns:
+        Dict[str, object]: Type, name and dimensions of container.
+    """
+    return {
+        "type": container.get_type(),
+        "name": container.get_name(),
+        "dimensions": _dimensions_to_dict(container._dimensions),
+    }
+
+
+def _holding_area_to_dict(holding_area: "HoldingArea") -> Dict[str, object]:
+    """
+    Converts a holding area and its container, if any, into the
+    dictionary format of model files.
+
+    Args:
+        holding_area (HoldingArea): Holding area to be converted.
+
+    Returns:
+        Dict[str, object]: Name, position and container of holding area.
+    """
+    holding_area_dict: Dict[str, object] = {
+        "name": holding_area.get_name(),
+        "position": _position_to_dict(holding_area._position),
+    }
+    container = holding_area._container
+    if container is not None:
+        holding_area_dict["container"] = _container_to_dict(container)
+    return holding_area_dict
+
+
+def _room_to_dict(room: "Room") -> Dict[str, object]:
+    """
+    Converts a room and its holding areas, if any, into the
+    dictionary format of model files.
+
+    Args:
+        room (Room): Room to be converted.
+
+    Returns:
+        Dict[str, object]:
+            Type, name, dimensions, position and holding areas of room.
+    """
+    room_dict: Dict[str, object] = {
+        "type": room.get_type(),
+        "name": room.get_name(),
+        "dimensions": _dimensions_to_dict(room._dimensions),
+        "position": _position_to_dict(room._position),
+    }
+    holding_area_inventory = room._holding_area_inventory
+    if holding_area_inventory:
+        room_dict["holding_areas"] = {
+            f"holding_area {k}": _holding_area_to_dict(holding_area)
+            for k, holding_area in enumerate(
+                holding_area_inventory.values(), 1
+            )
+        }
+    return room_dict
+
+
+def _facility_to_dict(facility: "Facility") -> Dict[str, object]:
+    """
+    Converts a facility and its rooms into the dictionary format
+    of model files.
+
+    Args:
+        facility (Facility): Facility to be converted.
+
+    Returns:
+        Dict[str, object]:
+            Type, name, dimensions, position and rooms of facility.
+    """
+    return {
+        "type": facility.get_type(),
+        "name": facility.get_name(),
+        "dimensions": _dimensions_to_dict(facility._dimensions),
+        "position": _position_to_dict(facility._position),
+        "rooms": {
+            f"room {j}": _room_to_dict(room)
+            for j, room in enumerate(facility._room_inventory.values(), 1)
+        },
+    }
+
+
+def _check_keys(stats: Dict, keys: Tuple[str, ...], description: str) -> None:
+    """
+    Checks that a model dictionary entry contains all required keys.
+
+    Args:
+        stats (Dict): Model dictionary entry to be checked.
+        keys (Tuple[str, ...]): Required keys.
+        description (str): Description of entry used in error message.
+
+    Raises:
+        KeyError: If entry is not a dictionary or a key is missing.
+    """
+    if not isinstance(stats, dict):
+        raise KeyError(f"{description} must be a dictionary.")
+    for key in keys:
+        if key not in stats:
+            raise KeyError(f"{description} must contain '{key}'.")
+
+
+def _validate_model(model: Dict[str, Dict]) -> None:
+    """
+    Validates structure of a model dictionary before any instance
+    is created from it, so that invalid input does not leave partly
+    built facilities in the registry.
+
+    Args:
+        model (Dict[str, Dict]):
+            Dictionary containing names and structure of
+            facilities, rooms and holding areas.
+
+    Raises:
+        KeyError:
+            If a required entry of the model is missing or
+            is not a dictionary.
+    """
+    # Model MUST contain at least one facility.
+    if not isinstance(model, dict) or len(model) < 2:
+        raise KeyError(
+            "Model must contain at least a time stamp and one facility."
+        )
+
+    for facility_key, facility_stats in model.items():
+        if facility_key == "time":
+            _check_keys(
+                facility_stats,
+                ("year", "month", "day", "hour", "minute"),
+                "Time stamp",
+            )
+            continue
+
+        facility = f"facility '{facility_key}'"
+        _check_keys(
+            facility_stats,
+            ("type", "name", "dimensions", "position", "rooms"),
+            f"Facility '{facility_key}'",
+        )
+        _check_keys(
+            facility_stats["dimensions"],
+            ("dx", "dy", "dz"),
+            f"Dimensions of {facility}",
+        )
+        _check_keys(
+            facility_stats["position"],
+            ("x", "y", "z"),
+            f"Position of {facility}",
+        )
+
+        # Facility MUST contain at least one room.
+        rooms = facility_stats["rooms"]
+        _check_keys(rooms, (), f"Rooms of {facility}")
+        if not rooms:
+            raise KeyError("Facility must contain at least one room.")
+
+        for room_key, room_stats in rooms.items():
+            room = f"room '{room_key}' of {facility}"
+            _check_keys(
+                room_stats,
+                ("type", "name", "dimensions", "position"),
+                f"Room '{room_key}' of {facility}",
+            )
+            _check_keys(
+                room_stats["dimensions"],
+                ("dx", "dy", "dz"),
+                f"Dimensions of {room}",
+            )
+            _check_keys(
+                room_stats["position"],
+                ("x", "y", "z"),
+                f"Position of {room}",
+            )
+
+            # Room MAY contain holding areas.
+            holding_areas = room_stats.get("holding_areas", _EMPTY_MAPPING)
+            if holding_areas is not _EMPTY_MAPPING:
+                _check_keys(holding_areas, (), f"Holding areas of {room}")
+
+            for holding_area_key, holding_area_stats in holding_areas.items():
+                holding_area = f"holding area '{holding_area_key}' of {room}"
+                _check_keys(
+                    holding_area_stats,
+                    ("name", "position"),
+                    f"Holding area '{holding_area_key}' of {room}",
+                )
+                _check_keys(
+                    holding_area_stats["position"],
+                    ("x", "y", "z"),
+                    f"Position of {holding_area}",
+                )
+
+                # Holding area MAY contain a container.
+                container_stats = holding_area_stats.get("container")
+                if container_stats is not None:
+                    container = f"container of {holding_area}"
+                    _check_keys(
+                        container_stats,
+                        ("type", "name", "dimensions"),
+                        f"Container of {holding_area}",
+                    )
+                    _check_keys(
+                        container_stats["dimensions"],
+                        ("dx", "dy", "dz"),
+                        f"Dimensions of {container}",
+                    )
+
 
 class InstanceNotFoundError(Exception):
     """
@@ -33,16 +369,18 @@ class MonitoringSystem:
     A class to monitor all instances listed in a registry indexed by their IDs.
 
     Attributes:
-        _registry (Dict[int, IDObject]):
-            Class-level dictionary to store instances
-            of IDObject, indexed by integer IDs.
-        _id_counter (int): Class-level counter to generate unique IDs.
+        _registry (List[IDObject]):
+            Class-level list to store instances of IDObject,
+            indexed by their sequential integer IDs.
+        _by_type (Dict[type, Dict[int, IDObject]]):
+            Class-level dictionary of registered instances grouped
+            by their class and its base classes, indexed by integer IDs.
         _global_time (datetime): Class-level global time in datetime format.
         _verbosity (int): Class-level verbosity setting.
     """
 
-    _registry: ClassVar[Dict[int, "IDObject"]] = {}
-    _id_counter: ClassVar[int] = 0
+    _registry: ClassVar[List["IDObject"]] = []
+    _by_type: ClassVar[Dict[type, Dict[int, "IDObject"]]] = {}
     _global_time: ClassVar[datetime] = datetime(2024, 1, 1, 0, 0)
     _verbosity: ClassVar[int] = 1  # 0: Silent, 1: Verbose
 
@@ -77,9 +415,11 @@ class MonitoringSystem:
         Returns:
             int: The unique ID assigned to the instance.
         """
-        instance_id = cls._id_counter
-        cls._registry[instance_id] = instance
-        cls._id_counter += 1
+        # IDs are dense, so the next ID is the next free list index
+        instance_id = len(cls._registry)
+        cls._registry.append(instance)
+        for class_type in type(instance).__mro__:
+            cls._by_type.setdefault(class_type, {})[instance_id] = instance
         return instance_id
 
     @classmethod
@@ -97,12 +437,18 @@ class MonitoringSystem:
             InstanceNotFoundError: If the instance with the
                 given ID is not found.
         """
-        if id not in cls._registry:
-            if cls.get_verbosity() > 0:
+        # Accept IDs that compare equal to an index, like the keys of
+        # a dictionary, and treat everything else as not found
+        try:
+            index = int(id)
+            if index != id or index < 0:
+                raise ValueError(id)
+            instance = cls._registry[index]
+        except (TypeError, ValueError, OverflowError, IndexError):
+            if cls._verbosity > 0:
                 print(f"Instance with ID '{id}' not found.")
-            raise InstanceNotFoundError()
-        instance = cls._registry[id]
-        if cls.get_verbosity() > 0:
+            raise InstanceNotFoundError() from None
+        if cls._verbosity > 0:
             print(
                 f"Retrieved instance with ID: {id}, "
                 f"Type: {type(instance).__name__}"
@@ -123,23 +469,34 @@ class MonitoringSystem:
             Dict[int, Facility]:
                 Dictionary of all registered instances matching class type.
         """
-        instance_inventory = {
-            id: instance
-            for id, instance in cls._registry.items()
-            if isinstance(instance, class_type)
-        }
-
-        if not instance_inventory:
+        # Fetch instances from type index instead of scanning registry
+        bucket = cls._by_type.get(class_type)
+        if not bucket:
             print(f"No instances of type '{class_type}' found.")
             raise InstanceNotFoundError()
+        instance_inventory: Dict[int, "IDObject"] = bucket.copy()
 
-        if cls.get_verbosity() > 0:
-            print("Retrieved instances: ")
-            for id, instance in instance_inventory.items():
-                print(f"ID: {id}, Type: {type(instance).__name__}")
+        if cls._verbosity > 0:
+            lines = ["Retrieved instances: "]
+            lines.extend(
+                f"ID: {id}, Type: {type(instance).__name__}"
+                for id, instance in instance_inventory.items()
+            )
+            print("\n".join(lines))
 
         return instance_inventory
 
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Clears the registry, resets the ID counter and the global time.
+        Previously registered instances are released and can be freed
+        before a new model is built.
+        """
+        cls._registry.clear()
+        cls._by_type.clear()
+        cls._global_time = datetime(2024, 1, 1, 0, 0)
+
     @classmethod
     def display_registry(cls) -> None:
         """
@@ -148,8 +505,12 @@ class MonitoringSystem:
         if not cls._registry:
             print("None.")
         else:
-            for id, instance in cls._registry.items():
-                print(f"ID: {id}, Type: {type(instance).__name__}")
+            print(
+                "\n".join(
+                    f"ID: {id}, Type: {type(instance).__name__}"
+                    for id, instance in enumerate(cls._registry)
+                )
+            )
 
     @classmethod
     def get_time(cls) -> str:
@@ -159,7 +520,7 @@ class MonitoringSystem:
         Returns:
             str: Current global time.
         """
-        if cls.get_verbosity() > 0:
+        if cls._verbosity > 0:
             print("Global time: ", cls._global_time.strftime("%Y:%m:%d.%H:%M"))
 
         return cls._global_time.strftime("%Y:%m:%d.%H:%M")
@@ -188,8 +549,8 @@ class MonitoringSystem:
             int: Duration between the start and end times in minutes.
         """
         # Parse start and end times
-        start_dt = datetime.strptime(start_time, "%Y:%m:%d.%H:%M")
-        end_dt = datetime.strptime(end_time, "%Y:%m:%d.%H:%M")
+        start_dt = _parse_time(start_time)
+        end_dt = _parse_time(end_time)
 
         current_dt = cls._global_time
 
@@ -197,7 +558,7 @@ class MonitoringSystem:
         if start_dt > current_dt:
             cls.set_time(end_dt)
 
-            if cls.get_verbosity() > 0:
+            if cls._verbosity > 0:
                 print(f"New global time is: {end_time}")
 
             return
@@ -210,7 +571,7 @@ class MonitoringSystem:
                 (current_dt - start_dt).total_seconds() / 60
             )  # Duration in minutes
 
-            if cls.get_verbosity() > 0:
+            if cls._verbosity > 0:
                 print(
                     f"""Start time is {duration_before_current_time}
                     min before current global time."""
@@ -229,7 +590,7 @@ class MonitoringSystem:
         # Increment global time by duration
         cls.increment_time(duration)
 
-        if cls.get_verbosity() > 0:
+        if cls._verbosity > 0:
             print(
                 f"Process duration: {duration} minutes."
                 f"\nNew global time is: {cls.get_time()}"
@@ -264,9 +625,7 @@ class MonitoringSystem:
         entry_no: int = 1
 
         for _id, facility in faciliy_inventory.items():
-            for _no, entry in (
-                facility.get_complete_history().get_entries().items()
-            ):
+            for _no, entry in facility.get_complete_history()._entries.items():
                 if entry is not None:
                     complete_history.set_entries(
                         entry,
@@ -291,9 +650,6 @@ class MonitoringSystem:
         # Get complete history of MonitoringSystem class
         complete_history = cls.get_complete_history()
 
-        # Create History for ongoing commands
-        ongoing_commands_at_time = History()
-
         # Interrupt process if complete history is empty
         if complete_history.get_entries() == {}:
             warn(
@@ -305,23 +661,7 @@ class MonitoringSystem:
 
         else:
             complete_history = complete_history.sort_history()
-
-            entry_no: int = 1
-            for _no, entry in complete_history.get_entries().items():
-                # Identify History entries with start times before and
-                # end times after target time
-                if (
-                    datetime.strptime(entry["start_time"], "%Y:%m:%d.%H:%M")
-                    < datetime.strptime(time, "%Y:%m:%d.%H:%M")
-                ) and (
-                    datetime.strptime(time, "%Y:%m:%d.%H:%M")
-                    < datetime.strptime(entry["end_time"], "%Y:%m:%d.%H:%M")
-                ):
-                    ongoing_commands_at_time.set_entries(
-                        entry,
-                        entry_no,
-                    )
-                    entry_no += 1
+            ongoing_commands_at_time = complete_history.ongoing_at_time(time)
 
         if ongoing_commands_at_time.get_entries() == {}:
             warn(
@@ -332,7 +672,6 @@ class MonitoringSystem:
         return ongoing_commands_at_time
 
 
-@dataclass
 class IDObject:
     """
     The base class for all registrable instances
@@ -345,8 +684,10 @@ class IDObject:
         _verbosity (int): Class-level verbosity setting.
     """
 
-    _id: int = field(init=False)
-    _init_time: str = field(init=False)
+    __slots__ = ("_id", "_init_time")
+
+    _id: int
+    _init_time: str
     _verbosity: ClassVar[int] = 1  # 0: Silent, 1: Verbose
 
     @classmethod
@@ -369,6 +710,24 @@ class IDObject:
         """
         return int(cls._verbosity)
 
+    def __init__(self) -> None:
+        self.__post_init__()
+
+    def __repr__(self) -> str:
+        """
+        Provides a string representation of the instance listing
+        all attributes in order of declaration.
+
+        Returns:
+            str: String representation of the instance.
+        """
+        attributes = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for cls in reversed(type(self).__mro__)
+            for name in cls.__dict__.get("__slots__", ())
+        )
+        return f"{type(self).__qualname__}({attributes})"
+
     def __post_init__(self) -> None:
         """
         Registers the instance in the registry after initialization
@@ -387,7 +746,6 @@ class IDObject:
         return int(self._id)
 
 
-@dataclass
 class HistoryObject(IDObject):
     """
     The base class for all instances that come with a history that
@@ -397,6 +755,8 @@ class HistoryObject(IDObject):
         _history (History): History instance.
     """
 
+    __slots__ = ("_history",)
+
     _history: "History"
 
     def __init__(self) -> None:
@@ -406,22 +766,22 @@ class HistoryObject(IDObject):
         super().__post_init__()
         self._history = History()
 
-    def activation(self, cmd: "Command", caller: "Commander") -> None:
+    def activation(self, cmd: "Command", caller: object) -> None:
         """
         Public activation function that ensures caller's identity before
         before calling private activation function.
 
         Args:
             cmd (Command): Instance of command that is meant to be processed.
-            caller (Commander):
-                Caller that needs to be instance of Commander class.
+            caller (object):
+                Authorization token that is only passed by Commander.
         """
-        if caller != Commander._authorized_commander:
+        if caller is not _AUTHORIZATION_TOKEN:
             raise PermissionError(
                 """Activation can only be called
                 within Commander.CreateTransportCommand."""
             )
-        self._activation(cmd)
+        cmd.apply(self)
 
     # @abstractmethod
     def _activation(
@@ -453,6 +813,16 @@ class HistoryObject(IDObject):
             cmd, changed_value_type, old_value, new_value
         )
 
+    def _transport_activation(self, cmd: "TransportCmd") -> None:
+        """
+        Registers a transport command passed to this instance.
+        Subclasses that are changed by transports redefine method.
+
+        Args:
+            cmd (TransportCmd): Instance of transport command to be processed.
+        """
+        self._activation(cmd)
+
     def get_instance_history(self) -> "History":
         """
         Gets History instance of HistoryObject instance.
@@ -475,6 +845,36 @@ class HistoryObject(IDObject):
         pass
 
 
+class HistoryEntry(NamedTuple):
+    """
+    A record of a change made to an instance by a command.
+
+    Attributes:
+        cmd_id (int): ID of command.
+        cmd_type (str): Type of command.
+        target (HistoryObject): Instance that is targeted by command.
+        start_time (str): Start time in the format YYYY:MM:DD.hh:mm.
+        end_time (str): End time in the format YYYY:MM:DD.hh:mm.
+        changed_value (str, optional):
+            String describing the type of value changed by command.
+        old_value (object, optional): Old value changed by command.
+        new_value (object, optional): New value replacing old value.
+        source (HistoryObject, optional):
+            Instance whose History contains the entry. Only set
+            when a complete history is created.
+    """
+
+    cmd_id: int
+    cmd_type: str
+    target: "HistoryObject"
+    start_time: str
+    end_time: str
+    changed_value: Optional[str] = None
+    old_value: object = None
+    new_value: object = None
+    source: Optional["HistoryObject"] = None
+
+
 @dataclass
 class History:
     """
@@ -483,12 +883,19 @@ class History:
 
     Attributes:
         _entry_no (int): Index for History entries
-        _entries (Dict[int, dict]): Dictionary to store
-            command specifications.
+        _entries (Dict[int, HistoryEntry]): Dictionary to store
+            HistoryEntry records.
+        _end_time_index (Tuple[List[datetime], List[int]], optional):
+            End times of entries in ascending order and the aligned
+            entry numbers. Built on demand and reset on every change
+            of entries.
     """
 
     _entry_no: int = 1
-    _entries: Dict[int, dict] = field(default_factory=dict)
+    _entries: Dict[int, HistoryEntry] = field(default_factory=dict)
+    _end_time_index: Optional[Tuple[List[datetime], List[int]]] = field(
+        default=None, repr=False, compare=False
+    )
 
     def __repr__(self) -> str:
         """
@@ -497,27 +904,26 @@ class History:
         Returns:
             str: String representation of the History instance.
         """
-        if not self.get_entries():
+        if not self._entries:
             return "History is empty."
         else:
-            return_str = ""
-            for id, command in self.get_entries().items():
-                return_str += (
+            # Collect parts and join once instead of growing a string
+            parts = []
+            for id, command in self._entries.items():
+                parts.append(
                     f"""Entry no. {id}:\n"""
-                    f"""Command ID: {command["cmd_id"]}, """
-                    f"""Type: {command["cmd_type"]}, """
-                    f"""Target: {command["target"].get_name()}, """
-                    f"""Start: {command["start_time"]}, """
-                    f"""End: {command["end_time"]}, """
-                    f"""Changed value: {command["changed_value"]}"""
+                    f"""Command ID: {command.cmd_id}, """
+                    f"""Type: {command.cmd_type}, """
+                    f"""Target: {command.target.get_name()}, """
+                    f"""Start: {command.start_time}, """
+                    f"""End: {command.end_time}, """
+                    f"""Changed value: {command.changed_value}"""
                 )
                 # Source instance added when complete history is created
-                if command["source"] is not None:
-                    return_str += (
-                        f""", Source: {command["source"].get_name()}"""
-                    )
-                return_str += ".\n"
-            return return_str
+                if command.source is not None:
+                    parts.append(f""", Source: {command.source.get_name()}""")
+                parts.append(".\n")
+            return "".join(parts)
 
     def set_entries(self, value: object, *keys) -> None:
         """
@@ -525,61 +931,98 @@ class History:
 
         Args:
             value (object):
-                Value to set at specified key path. If no keys provided
-                and value is a dictionary, entries will be replaced by value.
-            *keys (str):
-                Variable number of keys that specify path in nested dictionary
-                where value should be set.
+                Value to set. If no keys provided and value is a
+                dictionary, entries will be replaced by value.
+            *keys (int, str):
+                Entry number and, optionally, name of a HistoryEntry
+                field. Since entries are immutable, a field is set by
+                replacing the entry with an updated copy.
 
+        Raises:
+            KeyError: If entry or field to be set is not found.
         """
-        # Repplace entries with values if no keys given
+        self._end_time_index = None
+
+        # Replace entries with values if no keys given
         if not keys and isinstance(value, dict):
             self._entries.clear()
             self._entries.update(value)
             return
 
-        # Loop over keys
-        current_level = self._entries
-        for key in keys[:-1]:
-            if key not in current_level:
-                current_level[key] = {}
-            current_level = current_level[key]
+        if len(keys) == 1:
+            self._entries[keys[0]] = value
+            return
 
-        # Set the final value
-        current_level[keys[-1]] = value
+        entry, field_name = self._get_entry_field(*keys)
+        self._entries[keys[0]] = entry._replace(**{field_name: value})
 
-    def get_entries(self) -> Dict[int, dict]:
+    def get_entries(self) -> Dict[int, HistoryEntry]:
         """
         Gets entries of History instance's dictionary.
 
         Returns:
-            Dict[int, dict]: Dictionary with command specifications.
+            Dict[int, HistoryEntry]: Dictionary with HistoryEntry records.
 
         """
-        return copy(self._entries)
+        return self._entries.copy()
 
     def delete_entries(self, *keys) -> None:
         """
-        Deletes a value in History instance's dictionary.
+        Deletes an entry in History instance's dictionary or resets
+        an optional field of an entry to its default value.
 
         Args:
-            *keys (str):
-                Variable number of keys that specify path in nested dictionary
-                where key-value pair should be deleted.
+            *keys (int, str):
+                Entry number and, optionally, name of a HistoryEntry
+                field.
+
+        Raises:
+            KeyError:
+                If entry or field is not found or field has no default.
         """
         if not keys:
             warn("No keys as input. No changes made to History.")
             return
 
-        # Loop over keys and check if they exist
-        current_level = self._entries
-        for key in keys[:-1]:
-            if key not in current_level:
-                raise KeyError(f"Key '{key}' not found.")
-            current_level = current_level[key]
+        self._end_time_index = None
 
-        # Delete the final key if it exists
-        del current_level[keys[-1]]
+        if len(keys) == 1:
+            if keys[0] not in self._entries:
+                raise KeyError(f"Key '{keys[0]}' not found.")
+            del self._entries[keys[0]]
+            return
+
+        entry, field_name = self._get_entry_field(*keys)
+        if field_name not in HistoryEntry._field_defaults:
+            raise KeyError(f"Field '{field_name}' cannot be deleted.")
+        self._entries[keys[0]] = entry._replace(
+            **{field_name: HistoryEntry._field_defaults[field_name]}
+        )
+
+    def _get_entry_field(self, *keys) -> Tuple[HistoryEntry, str]:
+        """
+        Resolves a key path of entry number and field name.
+
+        Args:
+            *keys (int, str): Entry number and name of HistoryEntry field.
+
+        Returns:
+            Tuple[HistoryEntry, str]: Entry and name of field.
+
+        Raises:
+            KeyError: If key path, entry or field is not found.
+        """
+        if len(keys) != 2:
+            raise KeyError(
+                f"Key path {keys} must consist of entry number and field."
+            )
+        entry_no, field_name = keys
+        entry = self._entries.get(entry_no)
+        if entry is None:
+            raise KeyError(f"Key '{entry_no}' not found.")
+        if field_name not in HistoryEntry._fields:
+            raise KeyError(f"Key '{field_name}' not found.")
+        return entry, field_name
 
     def update_history(
         self,
@@ -589,7 +1032,7 @@ class History:
         new_value: object,
     ) -> None:
         """
-        Stores command specifications in a dictionary.
+        Stores command specifications as a HistoryEntry record.
 
         Args:
             cmd (Command): Instance of command to be processed.
@@ -600,18 +1043,17 @@ class History:
             new_value: (object):
                 Instance of new value replacing old value.
         """
-        cmd_dict = {
-            "cmd_id": cmd.get_id(),
-            "cmd_type": cmd.get_type(),
-            "target": cmd.get_target(),
-            "start_time": cmd.get_start_time(),
-            "end_time": cmd.get_end_time(),
-            "changed_value": changed_value_type,
-            "old_value": old_value,
-            "new_value": new_value,
-            "source": None,
-        }
-        self.set_entries(cmd_dict, self._entry_no)
+        entry = HistoryEntry(
+            cmd._id,
+            cmd._type,
+            cmd._target,
+            cmd._start_time,
+            cmd._end_time,
+            changed_value_type,
+            old_value,
+            new_value,
+        )
+        self.set_entries(entry, self._entry_no)
         self._entry_no += 1
 
     def at_time(self, time: str) -> "History":
@@ -628,16 +1070,92 @@ class History:
                 at a specific time.
         """
         history_at_time = History()
-        at_time_dict = {
-            id: entry
-            for id, entry in self.get_entries().items()
-            if datetime.strptime(entry["end_time"], "%Y:%m:%d.%H:%M")
-            < datetime.strptime(time, "%Y:%m:%d.%H:%M")
-        }
+        end_times, entry_nos = self.get_end_time_index()
+
+        # Entries ending before target time form a prefix of the index
+        cut = bisect_left(end_times, _parse_time(time))
+        at_time_dict = {no: self._entries[no] for no in entry_nos[:cut]}
         history_at_time.set_entries(at_time_dict)
 
         return history_at_time
 
+    def at_times(self, times: List[str]) -> List["History"]:
+        """
+        Gets history instances of HistoryObject instance at several
+        specific times with a single pass over the end time index.
+
+        Args:
+            times (List[str]): Times in the format YYYY:MM:DD.hh:mm.
+
+        Returns:
+            List[History]:
+                History instances at the specific times, in the
+                order of the given times.
+        """
+        end_times, entry_nos = self.get_end_time_index()
+        histories_at_times: List[History] = [History() for _ in times]
+
+        # Visit requested times in ascending order so that each cut
+        # continues the search where the previous one stopped
+        order = sorted(range(len(times)), key=lambda i: _parse_time(times[i]))
+        cut: int = 0
+        for i in order:
+            cut = bisect_left(end_times, _parse_time(times[i]), cut)
+            histories_at_times[i].set_entries(
+                {no: self._entries[no] for no in entry_nos[:cut]}
+            )
+
+        return histories_at_times
+
+    def ongoing_at_time(self, time: str) -> "History":
+        """
+        Gets History instance with entries of commands that are
+        ongoing at a specific time, i.e. started before and
+        end after that time.
+
+        Args:
+            time (str): Time in the format YYYY:MM:DD.hh:mm.
+
+        Returns:
+            History: History instance with ongoing commands.
+        """
+        ongoing_history = History()
+        end_times, entry_nos = self.get_end_time_index()
+        time_dt = _parse_time(time)
+
+        # Only entries ending after target time can be ongoing
+        first = bisect_right(end_times, time_dt)
+        entry_no: int = 1
+        for no in entry_nos[first:]:
+            entry = self._entries[no]
+            if _parse_time(entry.start_time) < time_dt:
+                ongoing_history.set_entries(entry, entry_no)
+                entry_no += 1
+
+        return ongoing_history
+
+    def get_end_time_index(self) -> Tuple[List[datetime], List[int]]:
+        """
+        Gets end times of History entries in ascending order together
+        with the aligned entry numbers. Entries with equal end times
+        keep their order. The index is built once and reused until
+        entries are changed.
+
+        Returns:
+            Tuple[List[datetime], List[int]]:
+                Sorted end times and corresponding entry numbers.
+        """
+        if self._end_time_index is None:
+            entry_nos = sorted(
+                self._entries,
+                key=lambda no: _parse_time(self._entries[no].end_time),
+            )
+            end_times = [
+                _parse_time(self._entries[no].end_time) for no in entry_nos
+            ]
+            self._end_time_index = (end_times, entry_nos)
+        return self._end_time_index
+
     def sort_history(self) -> "History":
         """
         Sorts History entries, primarily, chronologicaly by end_time and,
@@ -648,10 +1166,10 @@ class History:
         """
         sorted_dict = dict(
             sorted(
-                self.get_entries().items(),
+                self._entries.items(),
                 key=lambda item: (
-                    datetime.strptime(item[1]["end_time"], "%Y:%m:%d.%H:%M"),
-                    type(item[1]["source"]).__name__,
+                    _parse_time(item[1].end_time),
+                    type(item[1].source).__name__,
                 ),
             )
         )
@@ -659,7 +1177,6 @@ class History:
         return self
 
 
-@dataclass
 class Facility(HistoryObject):
     """
     A class that describes a facility.
@@ -673,11 +1190,19 @@ class Facility(HistoryObject):
             contained in facility.
     """
 
-    _type: str = None
-    _name: str = None
-    _dimensions: Dimensions = None
-    _position: Position = None
-    _room_inventory: Dict[int, "Room"] = field(default_factory=dict)
+    __slots__ = (
+        "_type",
+        "_name",
+        "_dimensions",
+        "_position",
+        "_room_inventory",
+    )
+
+    _type: str
+    _name: str
+    _dimensions: Dimensions
+    _position: Position
+    _room_inventory: Dict[int, "Room"]
 
     def __init__(
         self, type: str, name: str, dimensions: Dimensions, position: Position
@@ -700,12 +1225,12 @@ class Facility(HistoryObject):
 
     def set_type(self, type: str) -> None:
         """
-        Sets facility type.
+        Sets facility type as interned string.
 
         Args:
             type (str): Facility type.
         """
-        self._type: str = type
+        self._type: str = sys.intern(type)
 
     def get_type(self) -> str:
         """
@@ -779,9 +1304,8 @@ class Facility(HistoryObject):
         Args:
             room (Room): Room to be added to inventory.
         """
-        # Set new location to added room
-        room_location = Location(self)
-        room.set_location(room_location)
+        # Set new location to added room, which is valid by construction
+        room._location = Location(self)
 
         # Add room to inventory
         self._room_inventory[room.get_id()] = room
@@ -793,28 +1317,30 @@ class Facility(HistoryObject):
         Args:
             room_id (int): ID of room to be removed from inventory.
         """
-        if room_id not in self._room_inventory:
+        if self._room_inventory.pop(room_id, _MISSING) is _MISSING:
             raise KeyError(f"Room with ID {room_id} not found.")
-        if len(self._room_inventory) == 1 and room_id in self._room_inventory:
-            self._room_inventory.clear()
-        else:
-            del self._room_inventory[room_id]
 
-    def get_room_inventory(self) -> Dict[int, "Room"]:
+    def get_room_inventory(self) -> Mapping[int, "Room"]:
         """
-        Gets the facility's room inventory.
+        Gets a read-only view of the facility's room inventory.
+        The view reflects later changes to the inventory, so it must
+        be copied before rooms are removed while iterating over it.
 
         Returns:
-            Dict[int, Room]: Dictionary of rooms that are contained
+            Mapping[int, Room]: Mapping of rooms that are contained
                 in facility.
         """
-        if IDObject.get_verbosity() > 0:
-            if not self._room_inventory:
-                print("Room inventory is empty.")
-            else:
-                for id, room in self._room_inventory.items():
-                    print(f"ID: {id}, Type: Room, Name: {room.get_name()}")
-        return copy(self._room_inventory)
+        return MappingProxyType(self._room_inventory)
+
+    def print_room_inventory(self) -> None:
+        """
+        Prints the facility's room inventory.
+        """
+        if not self._room_inventory:
+            print("Room inventory is empty.")
+        else:
+            for id, room in self._room_inventory.items():
+                print(f"ID: {id}, Type: Room, Name: {room.get_name()}")
 
     def get_complete_history(self) -> "History":
         """
@@ -828,22 +1354,18 @@ class Facility(HistoryObject):
         entry_no: int = 1
 
         # Get Facility's Instance History entries
-        for _no, entry in self.get_instance_history().get_entries().items():
+        for _no, entry in self.get_instance_history()._entries.items():
             if entry is not None:
+                # Add source information
                 complete_history.set_entries(
-                    entry,
+                    entry._replace(source=self),
                     entry_no,
                 )
-
-                # Add source information
-                complete_history.set_entries(self, entry_no, "source")
                 entry_no += 1
 
         # Get Rooms' Complete History entries
-        for _no, room in self.get_room_inventory().items():
-            for _no2, entry in (
-                room.get_complete_history().get_entries().items()
-            ):
+        for _no, room in self._room_inventory.items():
+            for _no2, entry in room.get_complete_history()._entries.items():
                 if entry is not None:
                     complete_history.set_entries(
                         entry,
@@ -854,7 +1376,6 @@ class Facility(HistoryObject):
         return complete_history.sort_history()
 
 
-@dataclass
 class Room(HistoryObject):
     """
     A class that describes a room.
@@ -869,15 +1390,22 @@ class Room(HistoryObject):
             holding areas that are contained in room.
     """
 
-    _type: str = None
-    _name: str = None
-    _dimensions: Dimensions = None
-    _position: Position = None
-    _location: "Location" = None
-    _holding_area_inventory: Dict[int, "HoldingArea"] = field(
-        default_factory=dict
+    __slots__ = (
+        "_type",
+        "_name",
+        "_dimensions",
+        "_position",
+        "_location",
+        "_holding_area_inventory",
     )
 
+    _type: str
+    _name: str
+    _dimensions: Dimensions
+    _position: Position
+    _location: Optional["Location"]
+    _holding_area_inventory: Dict[int, "HoldingArea"]
+
     def __init__(
         self, type: str, name: str, dimensions: Dimensions, position: Position
     ):
@@ -895,16 +1423,17 @@ class Room(HistoryObject):
         self.set_name(name)
         self.set_dimensions(dimensions)
         self.set_position(position)
+        self._location = None
         self._holding_area_inventory = {}
 
     def set_type(self, type: str) -> None:
         """
-        Sets room type.
+        Sets room type as interned string.
 
         Args:
             type (str): Room type.
         """
-        self._type: str = type
+        self._type: str = sys.intern(type)
 
     def get_type(self) -> str:
         """
@@ -959,11 +1488,11 @@ class Room(HistoryObject):
         Args:
             location (Location): Location of room.
         """
-        if location.get_facility() is None:
+        if location._facility is None:
             raise KeyError("Facility must not be NoneType.")
-        elif location.get_room() is not None:
+        elif location._room is not None:
             raise KeyError("Room must be NoneType.")
-        elif location.get_holding_area() is not None:
+        elif location._holding_area is not None:
             raise KeyError("Holding area must be NoneType.")
         else:
             self._location: Location = location
@@ -1004,9 +1533,9 @@ class Room(HistoryObject):
             holding_area (HoldingArea):
                 Holding area to be added to inventory.
         """
-        # Set new location to added holding area
-        holding_area_location = Location(self._location.get_facility(), self)
-        holding_area.set_location(holding_area_location)
+        # Set new location to added holding area,
+        # which is valid by construction
+        holding_area._location = Location(self._location._facility, self)
 
         # Add holding area to inventory
         self._holding_area_inventory[holding_area.get_id()] = holding_area
@@ -1019,36 +1548,39 @@ class Room(HistoryObject):
             holding_area_id (int):
                 ID of holding area to be removed from inventory.
         """
-        if holding_area_id not in self._holding_area_inventory:
+        holding_area = self._holding_area_inventory.pop(
+            holding_area_id, _MISSING
+        )
+        if holding_area is _MISSING:
             raise KeyError(
                 f"Holding area with ID {holding_area_id} not found."
             )
-        if (
-            len(self._holding_area_inventory) == 1
-            and holding_area_id in self._holding_area_inventory
-        ):
-            self._holding_area_inventory.clear()
-        else:
-            del self._holding_area_inventory[holding_area_id]
 
-    def get_holding_area_inventory(self) -> Dict[int, "HoldingArea"]:
+    def get_holding_area_inventory(self) -> Mapping[int, "HoldingArea"]:
         """
-        Gets the room's holding area inventory.
+        Gets a read-only view of the room's holding area inventory.
+        The view reflects later changes to the inventory, so it must
+        be copied before holding areas are removed while iterating
+        over it.
 
         Returns:
-            Dict[int, HoldingArea]:
-                Dictionary of holding areas that are contained in room.
+            Mapping[int, HoldingArea]:
+                Mapping of holding areas that are contained in room.
         """
-        if IDObject.get_verbosity() > 0:
-            if not self._holding_area_inventory:
-                print("Holdingg area inventory is empty.")
-            else:
-                for id, holding_area in self._holding_area_inventory.items():
-                    print(
-                        f"ID: {id}, Type: Holding area, "
-                        f"Name: {holding_area.get_name()}"
-                    )
-        return copy(self._holding_area_inventory)
+        return MappingProxyType(self._holding_area_inventory)
+
+    def print_holding_area_inventory(self) -> None:
+        """
+        Prints the room's holding area inventory.
+        """
+        if not self._holding_area_inventory:
+            print("Holding area inventory is empty.")
+        else:
+            for id, holding_area in self._holding_area_inventory.items():
+                print(
+                    f"ID: {id}, Type: Holding area, "
+                    f"Name: {holding_area.get_name()}"
+                )
 
     def get_complete_history(self) -> "History":
         """
@@ -1062,37 +1594,31 @@ class Room(HistoryObject):
         entry_no: int = 1
 
         # Get Room's Instance History entries
-        for _no, entry in self.get_instance_history().get_entries().items():
+        for _no, entry in self.get_instance_history()._entries.items():
             if entry is not None:
+                # Add source information
                 complete_history.set_entries(
-                    entry,
+                    entry._replace(source=self),
                     entry_no,
                 )
-
-                # Add source information
-                complete_history.set_entries(self, entry_no, "source")
                 entry_no += 1
 
         # Get Holding area's Complete History entries
-        if self.get_holding_area_inventory() is not None:
+        for _no, holding_area in self._holding_area_inventory.items():
             for (
-                _no,
-                holding_area,
-            ) in self.get_holding_area_inventory().items():
-                for _no2, entry in (
-                    holding_area.get_complete_history().get_entries().items()
-                ):
-                    if entry is not None:
-                        complete_history.set_entries(
-                            entry,
-                            entry_no,
-                        )
-                        entry_no += 1
+                _no2,
+                entry,
+            ) in holding_area.get_complete_history()._entries.items():
+                if entry is not None:
+                    complete_history.set_entries(
+                        entry,
+                        entry_no,
+                    )
+                    entry_no += 1
 
         return complete_history.sort_history()
 
 
-@dataclass
 class HoldingArea(HistoryObject):
     """
     A class that describes a holding area for containers.
@@ -1102,16 +1628,15 @@ class HoldingArea(HistoryObject):
         _name (str): Name of holding area.
         _position (Position): Position of holding area.
         _location (Location): Location of holding area.
-        _occupation_status (bool):
-            True if holding area is occupied by container, False if not.
-        _container_inventory (Dict[int, Container]):
-            Dictionary of container in holding area.
+        _container (Container): Container in holding area, if any.
     """
 
-    _name: str = None
-    _position: Position = None
-    _location: "Location" = None
-    _container_inventory: Dict[int, "Container"] = field(default_factory=dict)
+    __slots__ = ("_name", "_position", "_location", "_container")
+
+    _name: str
+    _position: Position
+    _location: Optional["Location"]
+    _container: Optional["Container"]
 
     def __init__(self, name: str, position: Position):
         """ "
@@ -1123,9 +1648,9 @@ class HoldingArea(HistoryObject):
         """
         super().__init__()
         self.set_name(name)
-        self.set_occupation_status(False)
         self.set_position(position)
-        self._container_inventory = {}
+        self._location = None
+        self._container = None
 
     def set_name(self, name: str) -> None:
         """
@@ -1152,11 +1677,11 @@ class HoldingArea(HistoryObject):
         Args:
             location (Location): Location of holding area.
         """
-        if location.get_facility() is None:
+        if location._facility is None:
             raise KeyError("Facility must not be NoneType.")
-        elif location.get_room() is None:
+        elif location._room is None:
             raise KeyError("Room must not be NoneType.")
-        elif location.get_holding_area() is not None:
+        elif location._holding_area is not None:
             raise KeyError("Holding area must be NoneType.")
         else:
             self._location: Location = location
@@ -1189,23 +1714,14 @@ class HoldingArea(HistoryObject):
         """
         return copy(self._position)
 
-    def set_occupation_status(self, occupation_status: bool) -> None:
-        """
-        Sets occupation status to true or false.
-
-        Args:
-            occupation_status (bool): New occupation status.
-        """
-        self._occupation_status = occupation_status
-
     def get_occupation_status(self) -> bool:
         """
         Gets current occupation status.
 
         Returns:
-            bool: Current occupation status.
+            bool: True if holding area is occupied by container.
         """
-        return bool(self._occupation_status)
+        return self._container is not None
 
     def add_container(self, container: "Container") -> None:
         """
@@ -1214,34 +1730,31 @@ class HoldingArea(HistoryObject):
         Args:
             container (Container): Container to be added to holding area.
         """
-        if self.get_occupation_status() is True:
-            if IDObject.get_verbosity() > 0:
+        if self._container is not None:
+            if IDObject._verbosity > 0:
                 print("Holding Area is already occupied.")
         else:
-            # Set new location to added container
-            container_location = Location(
-                self.get_location().get_facility(),
-                self.get_location().get_room(),
-                self,
+            # Set new location to added container,
+            # which is valid by construction
+            location = self._location
+            container._location = Location(
+                location._facility, location._room, self
             )
-            container.set_location(container_location)
 
-            # Add container to inventory
-            self._container_inventory[container.get_id()] = container
-            self.set_occupation_status(True)
+            # Add container to holding area
+            self._container = container
 
     def remove_container(self) -> None:
         """
         Removes container from holding area.
         """
-        if IDObject.get_verbosity() > 0:
-            for id, container in self._container_inventory.items():
-                print(
-                    f"ID: {id}, Container: {container} "
-                    "removed from holding area."
-                )
-        self._container_inventory.clear()
-        self.set_occupation_status(False)
+        container = self._container
+        if container is not None and IDObject._verbosity > 0:
+            print(
+                f"ID: {container.get_id()}, Container: {container} "
+                "removed from holding area."
+            )
+        self._container = None
 
     def get_container(self) -> "Container":
         """
@@ -1251,58 +1764,70 @@ class HoldingArea(HistoryObject):
             Container:
                 Container that is contained in holding area.
         """
-        if self._occupation_status is False:
-            if IDObject.get_verbosity() > 0:
-                print("No container in holding area.")
+        return self._container
+
+    def _get_container_inventory(self) -> Dict[int, "Container"]:
+        """
+        Gets container in holding area as dictionary indexed by ID,
+        as recorded in history entries.
+
+        Returns:
+            Dict[int, Container]:
+                Dictionary of container in holding area.
+        """
+        container = self._container
+        if container is None:
+            return {}
+        return {container.get_id(): container}
+
+    def print_container(self) -> None:
+        """
+        Prints the container contained in holding area.
+        """
+        container = self._container
+        if container is None:
+            print("No container in holding area.")
         else:
-            for id, container in self._container_inventory.items():
-                if IDObject.get_verbosity() > 0:
-                    print(
-                        f"ID: {id}, Type: Container, "
-                        f"Name: {container.get_name()}"
-                    )
-                return container
+            print(
+                f"ID: {container.get_id()}, Type: Container, "
+                f"Name: {container.get_name()}"
+            )
 
-    def _activation(self, cmd: "Command") -> None:
+    def _transport_activation(self, cmd: "TransportCmd") -> None:
         """
-        Registers a command passed to this instance and
-        activates certain functions based on the command type.
+        Registers a transport command passed to this instance and
+        removes or adds the transported container.
 
         Args:
-            cmd (Command): Instance of command to be processed.
+            cmd (TransportCmd): Instance of transport command to be processed.
         """
-        if type(cmd) is TransportCmd:
-            old_container_inventory = copy(self._container_inventory)
-            old_occupation_status = self.get_occupation_status()
+        old_container_inventory = self._get_container_inventory()
+        old_occupation_status = self.get_occupation_status()
 
-            # Remove container if holding area is at origin of transport
-            if self is cmd.get_origin().get_holding_area():
-                self.remove_container()
+        # Remove container if holding area is at origin of transport
+        if self is cmd._origin._holding_area:
+            self.remove_container()
 
-            # Add container if holding area is at destination of transport
-            if self is cmd.get_destination().get_holding_area():
-                self.add_container(cmd.get_target())
+        # Add container if holding area is at destination of transport
+        if self is cmd._destination._holding_area:
+            self.add_container(cmd._target)
 
-            new_container_inventory = copy(self._container_inventory)
-            new_occupation_status = self.get_occupation_status()
-
-            # Update own history
-            super()._activation(
-                cmd,
-                changed_value_type="container_inventory",
-                old_value=old_container_inventory,
-                new_value=new_container_inventory,
-            )
-            super()._activation(
-                cmd,
-                changed_value_type="occupation_status",
-                old_value=old_occupation_status,
-                new_value=new_occupation_status,
-            )
-            return
+        new_container_inventory = self._get_container_inventory()
+        new_occupation_status = self.get_occupation_status()
 
         # Update own history
-        super()._activation(cmd)
+        self._activation(
+            cmd,
+            changed_value_type="container_inventory",
+            old_value=old_container_inventory,
+            new_value=new_container_inventory,
+        )
+        self._activation(
+            cmd,
+            changed_value_type="occupation_status",
+            old_value=old_occupation_status,
+            new_value=new_occupation_status,
+        )
 
     def get_complete_history(self) -> "History":
         """
@@ -1316,37 +1841,33 @@ class HoldingArea(HistoryObject):
         entry_no: int = 1
 
         # Get Holding area's Instance History entries
-        for _no, entry in self.get_instance_history().get_entries().items():
+        for _no, entry in self.get_instance_history()._entries.items():
             if entry is not None:
+                # Add source information
                 complete_history.set_entries(
-                    entry,
+                    entry._replace(source=self),
                     entry_no,
                 )
-
-                # Add source information
-                complete_history.set_entries(self, entry_no, "source")
                 entry_no += 1
 
         # Get Container's Instance History entries
         container = self.get_container()
         if container is not None:
-            for _no, entry in (
-                container.get_instance_history().get_entries().items()
-            ):
+            for (
+                _no,
+                entry,
+            ) in container.get_instance_history()._entries.items():
                 if entry is not None:
+                    # Add source information
                     complete_history.set_entries(
-                        entry,
+                        entry._replace(source=container),
                         entry_no,
                     )
-
-                    # Add source information
-                    complete_history.set_entries(container, entry_no, "source")
                     entry_no += 1
 
         return complete_history.sort_history()
 
 
-@dataclass
 class Container(HistoryObject):
     """
     A class that describes a container for nuclear material.
@@ -1359,10 +1880,12 @@ class Container(HistoryObject):
 
     """
 
-    _type: str = None
-    _name: str = None
-    _dimensions: Dimensions = None
-    _location: "Location" = None
+    __slots__ = ("_type", "_name", "_dimensions", "_location")
+
+    _type: str
+    _name: str
+    _dimensions: Dimensions
+    _location: Optional["Location"]
 
     def __init__(self, type: str, name: str, dimensions: Dimensions):
         """ "
@@ -1377,15 +1900,16 @@ class Container(HistoryObject):
         self.set_type(type)
         self.set_name(name)
         self.set_dimensions(dimensions)
+        self._location = None
 
     def set_type(self, type: str) -> None:
         """
-        Sets container type.
+        Sets container type as interned string.
 
         Args:
             type (str): Container type.
         """
-        self._type: str = type
+        self._type: str = sys.intern(type)
 
     def get_type(self) -> str:
         """
@@ -1440,11 +1964,11 @@ class Container(HistoryObject):
         Args:
             location (Location): New location of container.
         """
-        if location.get_facility() is None:
+        if location._facility is None:
             raise KeyError("Facility must not be NoneType.")
-        elif location.get_room() is None:
+        elif location._room is None:
             raise KeyError("Room must not be NoneType.")
-        elif location.get_holding_area() is None:
+        elif location._holding_area is None:
             raise KeyError("Holding area must not be NoneType.")
         else:
             self._location: Location = location
@@ -1458,35 +1982,29 @@ class Container(HistoryObject):
         """
         return copy(self._location)
 
-    def _activation(self, cmd: "Command") -> None:
+    def _transport_activation(self, cmd: "TransportCmd") -> None:
         """
-        Registers a command passed to this instance and
-        activates certain functions based on the command type.
+        Registers a transport command passed to this instance and
+        moves container to destination of transport.
 
         Args:
-            cmd (Command): Instance of command to be processed.
+            cmd (TransportCmd): Instance of transport command to be processed.
         """
-        if type(cmd) is TransportCmd:
-            origin = cmd.get_origin()
-            destination = cmd.get_destination()
-
-            # Update own location to destination
-            self.set_location(destination)
+        origin = cmd.get_origin()
+        destination = cmd.get_destination()
 
-            # Update own history
-            super()._activation(
-                cmd,
-                changed_value_type="Location",
-                old_value=copy(origin),
-                new_value=copy(destination),
-            )
-            return
+        # Update own location to destination, which Commander validated
+        self._location = destination
 
         # Update own history
-        super()._activation(cmd)
+        self._activation(
+            cmd,
+            changed_value_type="Location",
+            old_value=copy(origin),
+            new_value=copy(destination),
+        )
 
 
-@dataclass
 class Location:
     """
     A class that specifies the location of an instance
@@ -1498,9 +2016,11 @@ class Location:
         _holding_area (HoldingArea): Corresponding holding area instance.
     """
 
-    _facility: Facility = None
-    _room: Room = None
-    _holding_area: HoldingArea = None
+    __slots__ = ("_facility", "_room", "_holding_area")
+
+    _facility: Facility
+    _room: Optional[Room]
+    _holding_area: Optional[HoldingArea]
 
     def __init__(
         self,
@@ -1518,11 +2038,18 @@ class Location:
             holding_area (HoldingArea, optional):
                 Corresponding holding area instance (default is 'None').
         """
-        self.set_facility(facility)
-        if room is not None:
-            self.set_room(room)
-        if holding_area is not None:
-            self.set_holding_area(holding_area)
+        self._facility = facility
+        self._room = room
+        self._holding_area = holding_area
+
+    def __copy__(self) -> "Location":
+        """
+        Creates a shallow copy of the Location instance.
+
+        Returns:
+            Location: New Location instance with same components.
+        """
+        return Location(self._facility, self._room, self._holding_area)
 
     def __repr__(self) -> str:
         """
@@ -1606,7 +2133,6 @@ class Location:
         return self._holding_area
 
 
-@dataclass
 class Command(IDObject):
     """
     The base class for all instances that specify commands.
@@ -1619,6 +2145,8 @@ class Command(IDObject):
         _end_time (str): End time in the format YYYY:MM:DD.hh:mm.
     """
 
+    __slots__ = ("_type", "_target", "_start_time", "_end_time")
+
     _type: str
     _target: HistoryObject
     _start_time: str
@@ -1643,6 +2171,16 @@ class Command(IDObject):
         self.set_end_time(end_time)
         MonitoringSystem.process_time(start_time, end_time)
 
+    def apply(self, target: HistoryObject) -> None:
+        """
+        Applies command to an instance by calling its activation
+        function that matches the command type.
+
+        Args:
+                target (HistoryObject): Instance the command is applied to.
+        """
+        target._activation(self)
+
     def set_type(self, type: str) -> None:
         """
         Sets command type.
@@ -1718,7 +2256,6 @@ class Command(IDObject):
         return str(self._end_time)
 
 
-@dataclass
 class TransportCmd(Command):
     """
     A class that specifies a transport command from an origin to a destination.
@@ -1728,6 +2265,8 @@ class TransportCmd(Command):
         _destination (Location): Destination of transport.
     """
 
+    __slots__ = ("_origin", "_destination")
+
     _origin: Location
     _destination: Location
 
@@ -1754,6 +2293,15 @@ class TransportCmd(Command):
         self.set_origin(origin)
         self.set_destination(destination)
 
+    def apply(self, target: HistoryObject) -> None:
+        """
+        Applies transport command to an instance.
+
+        Args:
+                target (HistoryObject): Instance the command is applied to.
+        """
+        target._transport_activation(self)
+
     def __repr__(self) -> str:
         """
         Provides a string representation of the Command instance.
@@ -1807,27 +2355,8 @@ class TransportCmd(Command):
 class Commander:
     """
     A class that creates commands based on user input.
-
-    Attributes:
-        _authorized_commander (Commander):
-            Commander instance that is authorized to activate
-            other instances.
     """
 
-    _authorized_commander: "Commander" = None
-
-    @contextmanager
-    def _authorize(self):
-        """
-        Authorizes Commander instance to activate other instances.
-        """
-        old_commander = Commander._authorized_commander
-        Commander._authorized_commander = self
-        try:
-            yield
-        finally:
-            Commander._authorized_commander = old_commander
-
     def issue_transport_command(
         self,
         target: Container,
@@ -1846,29 +2375,34 @@ class Commander:
             start_time (str): Start time in the format YYYY:MM:DD.hh:mm.
             end_time (str): End time in the format YYYY:MM:DD.hh:mm.
         """
+        # Read target's current location and destination once for all
+        # checks and bind holding areas that are needed again for activation
+        current_location = target._location
+        current_holding_area = current_location._holding_area
+        destination_facility = destination._facility
+        destination_room = destination._room
+        destination_holding_area = destination._holding_area
+
         # Check that origin Location matches current position of target
-        if origin.get_facility() is not target.get_location().get_facility():
+        if origin._facility is not current_location._facility:
             raise KeyError(
                 "Origin Facility must be same as target's current Facility."
             )
-        if origin.get_room() is not target.get_location().get_room():
+        if origin._room is not current_location._room:
             raise KeyError(
                 "Origin Room must be same as target's current Room."
             )
-        if (
-            origin.get_holding_area()
-            is not target.get_location().get_holding_area()
-        ):
+        if origin._holding_area is not current_holding_area:
             raise KeyError(
                 """Origin Holding area must be the same
                 as target's current Holding area."""
             )
         # Check that destination Location does not contain NoneTypes
-        elif not destination.get_facility():
+        elif destination_facility is None:
             raise KeyError("Destination Facility must not be NoneType.")
-        elif not destination.get_room():
+        elif destination_room is None:
             raise KeyError("Destination Room must not be NoneType.")
-        elif not destination.get_holding_area():
+        elif destination_holding_area is None:
             raise KeyError("Destination Holding area must not be NoneType.")
         else:
             # Create Command
@@ -1876,17 +2410,97 @@ class Commander:
                 target, origin, destination, start_time, end_time
             )
 
-            with self._authorize():
-                # Activate holding area at origin of transport
-                current_holding_area = target.get_location().get_holding_area()
-                current_holding_area.activation(cmd, self)
-
-                # Activate holding area at destination of transport
-                destination_holding_area = destination.get_holding_area()
-                destination_holding_area.activation(cmd, self)
-
-                # Activate target container
-                target.activation(cmd, self)
+            # Activate holding areas at origin and destination of
+            # transport and target container, in this order
+            for component in (
+                current_holding_area,
+                destination_holding_area,
+                target,
+            ):
+                component.activation(cmd, _AUTHORIZATION_TOKEN)
+
+
+# Dummy model data, built once at import and only read by Builder
+_DUMMY_MODEL: Dict[str, Dict] = {
+    "time": {
+        "year": "2024",
+        "month": "08",
+        "day": "06",
+        "hour": "14",
+        "minute": "19",
+    },
+    "facility 1": {
+        "type": "Interim storage",
+        "name": "Facility 1",
+        "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
+        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+        "rooms": {
+            "room 1": {
+                "type": "Storage",
+                "name": "Room 1.1",
+                "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
+                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+                "holding_areas": {
+                    "holding_area 1": {
+                        "name": "HoldingArea 1.1.1",
+                        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+                        "container": {
+                            "type": "Castor",
+                            "name": "Container 1",
+                            "dimensions": {
+                                "dx": 1.0,
+                                "dy": 1.0,
+                                "dz": 1.0,
+                            },
+                        },
+                    },
+                    "holding_area 2": {
+                        "name": "HoldingArea 1.1.2",
+                        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+                    },
+                },
+            },
+            "room 2": {
+                "type": "Storage",
+                "name": "Room 1.2",
+                "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
+                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+                "holding_areas": {
+                    "holding_area 1": {
+                        "name": "HoldingArea 1.2.1",
+                        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+                    }
+                },
+            },
+        },
+    },
+    "facility 2": {
+        "type": "Geological repository",
+        "name": "Facility 2",
+        "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
+        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+        "rooms": {
+            "room 1": {
+                "type": "Shaft",
+                "name": "Room 2.1",
+                "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
+                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+            },
+            "room 2": {
+                "type": "Drift",
+                "name": "Room 2.2",
+                "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
+                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+                "holding_areas": {
+                    "holding_area 1": {
+                        "name": "HoldingArea 2.2.1",
+                        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+                    }
+                },
+            },
+        },
+    },
+}
 
 
 @dataclass
@@ -1894,8 +2508,23 @@ class Builder:
     """
     A class that constructs models and exports model data based on
     user input.
+
+    Attributes:
+        _model_file_cache (Dict[str, Tuple[Tuple[int, int], Dict]]):
+            Class-level cache of parsed model files, indexed by file
+            path and stamped with modification time and size. Holds
+            at most _model_file_cache_size files.
+        _model_file_cache_size (int):
+            Class-level maximum number of cached model files.
     """
 
+    __slots__ = ()
+
+    _model_file_cache: ClassVar[
+        Dict[str, Tuple[Tuple[int, int], Dict[str, Dict]]]
+    ] = {}
+    _model_file_cache_size: ClassVar[int] = 4
+
     def _build_model(self, model: Dict[str, Dict]) -> None:
         """
         Builds a model on a dictionary-based
@@ -1908,13 +2537,12 @@ class Builder:
             adjacency ():
                 Matrix specifying adjacency for rooms
                 through entries and exits.
-        """
 
-        # Model MUST contain at least one facility.
-        if not model or len(model) < 2:
-            raise KeyError(
-                "Model must contain at least a time stamp and one facility."
-            )
+        Raises:
+            KeyError: If a required entry of the model is missing.
+        """
+        # Validate complete model before creating any instances
+        _validate_model(model)
 
         for _facility, facility_stats in model.items():
             # Synchronize global time with model's timestamp
@@ -1934,82 +2562,70 @@ class Builder:
                     type=facility_stats["type"],
                     name=facility_stats["name"],
                     dimensions=Dimensions(
-                        facility_stats["dimensions"]["dx"],
-                        facility_stats["dimensions"]["dy"],
-                        facility_stats["dimensions"]["dx"],
+                        *_get_dimensions(facility_stats["dimensions"])
                     ),
                     position=Position(
-                        facility_stats["position"]["x"],
-                        facility_stats["position"]["y"],
-                        facility_stats["position"]["z"],
+                        *_get_position(facility_stats["position"])
                     ),
                 )
 
                 # Initialize room with data from dictionary
                 #       Facility MUST contain at least one room.
-                if not facility_stats["rooms"]:
-                    raise KeyError("Facility must contain at least one room.")
-
                 model_2: Dict[str, Dict] = facility_stats["rooms"]
                 for _room, room_stats in model_2.items():
                     roomInstance = Room(
                         type=room_stats["type"],
                         name=room_stats["name"],
                         dimensions=Dimensions(
-                            room_stats["dimensions"]["dx"],
-                            room_stats["dimensions"]["dy"],
-                            room_stats["dimensions"]["dx"],
+                            *_get_dimensions(room_stats["dimensions"])
                         ),
                         position=Position(
-                            room_stats["position"]["x"],
-                            room_stats["position"]["y"],
-                            room_stats["position"]["z"],
+                            *_get_position(room_stats["position"])
                         ),
                     )
 
                     # Add room to facility
                     facilityInstance.add_room(roomInstance)
 
-                    if len(room_stats) > 4:
-                        # Initialize holding area with data from dictionary
-                        #       Room MAY contain holding areas.
-                        model_3: Dict[str, Dict] = room_stats["holding_areas"]
-                        for (
-                            _holding_area,
-                            holding_area_stats,
-                        ) in model_3.items():
-                            holding_areaInstance = HoldingArea(
-                                name=holding_area_stats["name"],
-                                position=Position(
-                                    holding_area_stats["position"]["x"],
-                                    holding_area_stats["position"]["y"],
-                                    holding_area_stats["position"]["z"],
+                    # Initialize holding area with data from dictionary
+                    #       Room MAY contain holding areas.
+                    model_3: Dict[str, Dict] = room_stats.get(
+                        "holding_areas", _EMPTY_MAPPING
+                    )
+                    for (
+                        _holding_area,
+                        holding_area_stats,
+                    ) in model_3.items():
+                        holding_areaInstance = HoldingArea(
+                            name=holding_area_stats["name"],
+                            position=Position(
+                                *_get_position(holding_area_stats["position"])
+                            ),
+                        )
+
+                        # Add holding area to room
+                        roomInstance.add_holding_area(holding_areaInstance)
+
+                        # Initialize container with data from dictionary
+                        #       Holding area MAY contain a container.
+                        model_4: Optional[Dict] = holding_area_stats.get(
+                            "container"
+                        )
+                        if model_4 is not None:
+                            containerInstance = Container(
+                                type=model_4["type"],
+                                name=model_4["name"],
+                                dimensions=Dimensions(
+                                    *_get_dimensions(model_4["dimensions"])
                                 ),
                             )
 
-                            # Add holding area to room
-                            roomInstance.add_holding_area(holding_areaInstance)
-
-                            # Initialize container with data from dictionary
-                            #       Holding area MAY contain a container.
-                            if len(holding_area_stats) > 2:
-                                model_4: Dict = holding_area_stats["container"]
-                                containerInstance = Container(
-                                    type=model_4["type"],
-                                    name=model_4["name"],
-                                    dimensions=Dimensions(
-                                        model_4["dimensions"]["dx"],
-                                        model_4["dimensions"]["dy"],
-                                        model_4["dimensions"]["dx"],
-                                    ),
-                                )
-
-                                # Add container to holding area
-                                holding_areaInstance.add_container(
-                                    containerInstance
-                                )
-
-        if MonitoringSystem.get_verbosity() > 0:
+                            # Add container to holding area
+                            holding_areaInstance.add_container(
+                                containerInstance
+                            )
+
+        if MonitoringSystem._verbosity > 0:
             print("\nAll registered instances:")
             MonitoringSystem.display_registry()
 
@@ -2026,107 +2642,31 @@ class Builder:
                 Matrix specifying adjacency for rooms
                 through entries and exits.
         """
-        model: Dict[str, Dict] = {}
-
-        # Get current time and write it into dictionary
+        # Get current time and split it into its fields
         current_time: str = MonitoringSystem.get_time()
+        year, month, day, hour, minute = _TIME_PATTERN.fullmatch(
+            current_time
+        ).groups()
 
-        date_part, time_part = current_time.split(".")
-        year, month, day = date_part.split(":")
-        hour, minute = time_part.split(":")
-
-        model["time"] = {
-            "year": year,
-            "month": month,
-            "day": day,
-            "hour": hour,
-            "minute": minute,
-        }
-
-        # Get facilities from registry and write stats into dictionary
+        # Get facilities from registry
         faciliy_inventory: Dict[int, Facility] = (
             MonitoringSystem.get_instance_by_type(Facility)
         )
-        i: int = 1
-        for _id, facility in faciliy_inventory.items():
-            model["facility " + str(i)] = {
-                "type": facility.get_type(),
-                "name": facility.get_name(),
-                "dimensions": {
-                    "dx": facility.get_dimensions().get_x(),
-                    "dy": facility.get_dimensions().get_y(),
-                    "dz": facility.get_dimensions().get_z(),
-                },
-                "position": {
-                    "x": facility.get_position().get_x(),
-                    "y": facility.get_position().get_y(),
-                    "z": facility.get_position().get_z(),
-                },
-            }
-
-            # Get Rooms
-            room_inventory: Dict[int, Room] = facility.get_room_inventory()
-            model["facility " + str(i)]["rooms"] = {}
-            j: int = 1
-            for _id, room in room_inventory.items():
-                model["facility " + str(i)]["rooms"]["room " + str(j)] = {
-                    "type": room.get_type(),
-                    "name": room.get_name(),
-                    "dimensions": {
-                        "dx": room.get_dimensions().get_x(),
-                        "dy": room.get_dimensions().get_y(),
-                        "dz": room.get_dimensions().get_z(),
-                    },
-                    "position": {
-                        "x": room.get_position().get_x(),
-                        "y": room.get_position().get_y(),
-                        "z": room.get_position().get_z(),
-                    },
-                }
-
-                # Get Holding areas (if any)
-                holding_area_inventory: Dict[int, HoldingArea] = (
-                    room.get_holding_area_inventory()
-                )
-                if holding_area_inventory:
-                    model["facility " + str(i)]["rooms"]["room " + str(j)][
-                        "holding_areas"
-                    ] = {}
-                    k: int = 1
-                    for _id, holding_area in holding_area_inventory.items():
-                        model["facility " + str(i)]["rooms"]["room " + str(j)][
-                            "holding_areas"
-                        ]["holding_area " + str(k)] = {
-                            "name": holding_area.get_name(),
-                            "position": {
-                                "x": holding_area.get_position().get_x(),
-                                "y": holding_area.get_position().get_y(),
-                                "z": holding_area.get_position().get_z(),
-                            },
-                        }
-
-                        # Get Container (if any)
-                        container: Container = holding_area.get_container()
-                        if container:
-                            model["facility " + str(i)]["rooms"][
-                                "room " + str(j)
-                            ]["holding_areas"]["holding_area " + str(k)][
-                                "container"
-                            ] = {
-                                "type": container.get_type(),
-                                "name": container.get_name(),
-                                "dimensions": {
-                                    "dx": container.get_dimensions().get_x(),
-                                    "dy": container.get_dimensions().get_y(),
-                                    "dz": container.get_dimensions().get_z(),
-                                },
-                            }
-                        k += 1
-                    k = 1
-                j += 1
-            j = 1
-            i += 1
 
+        # Assemble time and facility stats into dictionary
+        model: Dict[str, Dict] = {
+            "time": {
+                "year": year,
+                "month": month,
+                "day": day,
+                "hour": hour,
+                "minute": minute,
+            },
+        }
+        model.update(
+            (f"facility {i}", _facility_to_dict(facility))
+            for i, facility in enumerate(faciliy_inventory.values(), 1)
+        )
         return model
 
     def _get_model_state_at_time(self, time: str) -> Dict[str, Dict]:
@@ -2153,7 +2693,7 @@ class Builder:
         complete_history = MonitoringSystem.get_complete_history()
 
         # Interrupt process if complete history is empty
-        if complete_history.get_entries == {}:
+        if not complete_history._entries:
             warn(
                 """History of all instances in model is empty.
                 Model of current state returned.""",
@@ -2164,32 +2704,27 @@ class Builder:
         else:
             complete_history = complete_history.sort_history()
 
+            # Slice complete history at target time now instead of
+            # walking all facilities' histories again for the check below
+            entries_at_time = complete_history.at_time(time).get_entries()
+
+            time_dt = _parse_time(time)
             entry_no: int = 1
             for no, entry in complete_history.get_entries().items():
                 # Identify History entries with start times after target date
-                if datetime.strptime(
-                    time, "%Y:%m:%d.%H:%M"
-                ) < datetime.strptime(entry["start_time"], "%Y:%m:%d.%H:%M"):
-                    changed_value_type: str = entry["changed_value"]
-                    source_type: type = type(entry["source"])
+                if time_dt < _parse_time(entry.start_time):
+                    changed_value_type: str = entry.changed_value
+                    source_type: type = type(entry.source)
 
                     # Undo changes done by commands based on source type.
                     if source_type is Container:
                         # Undo changes to container based on changed value type
                         if changed_value_type == "Location":
-                            target: Container = entry["target"]
-                            container_stats: dict = {
-                                "type": target.get_type(),
-                                "name": target.get_name(),
-                                "dimensions": {
-                                    "dx": target.get_dimensions().get_x(),
-                                    "dy": target.get_dimensions().get_y(),
-                                    "dz": target.get_dimensions().get_z(),
-                                },
-                            }
-
-                            old_value: Location = entry["old_value"]
-                            new_value: Location = entry["new_value"]
+                            target: Container = entry.target
+                            container_stats: dict = _container_to_dict(target)
+
+                            old_value: Location = entry.old_value
+                            new_value: Location = entry.new_value
 
                             current_facility_name = (
                                 new_value.get_facility().get_name()
@@ -2284,113 +2819,60 @@ class Builder:
                 # Identify History entries with start times before/ end times
                 # after target date (ongoing commands) and remove them
                 if (
-                    datetime.strptime(entry["start_time"], "%Y:%m:%d.%H:%M")
-                    < datetime.strptime(time, "%Y:%m:%d.%H:%M")
-                ) and (
-                    datetime.strptime(time, "%Y:%m:%d.%H:%M")
-                    < datetime.strptime(entry["end_time"], "%Y:%m:%d.%H:%M")
+                    _parse_time(entry.start_time)
+                    < time_dt
+                    < _parse_time(entry.end_time)
                 ):
                     complete_history.delete_entries(no)
                     entry_no += 1
 
             # After removing all previously processed entries, the remainder
             # should beequivalent to the complete history at target time
-            assert (
-                complete_history.get_entries()
-                == MonitoringSystem.get_complete_history()
-                .at_time(time)
-                .get_entries()
-            )
+            assert complete_history.get_entries() == entries_at_time
 
             return model
 
     def load_dummy_model(self) -> None:
         """
-        Creates a dictionary with dummy model data and
-        builds the model.
+        Builds the model from the module-level dummy model data.
         """
-        dummy_model = {
-            "time": {
-                "year": "2024",
-                "month": "08",
-                "day": "06",
-                "hour": "14",
-                "minute": "19",
-            },
-            "facility 1": {
-                "type": "Interim storage",
-                "name": "Facility 1",
-                "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
-                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
-                "rooms": {
-                    "room 1": {
-                        "type": "Storage",
-                        "name": "Room 1.1",
-                        "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
-                        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
-                        "holding_areas": {
-                            "holding_area 1": {
-                                "name": "HoldingArea 1.1.1",
-                                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
-                                "container": {
-                                    "type": "Castor",
-                                    "name": "Container 1",
-                                    "dimensions": {
-                                        "dx": 1.0,
-                                        "dy": 1.0,
-                                        "dz": 1.0,
-                                    },
-                                },
-                            },
-                            "holding_area 2": {
-                                "name": "HoldingArea 1.1.2",
-                                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
-                            },
-                        },
-                    },
-                    "room 2": {
-                        "type": "Storage",
-                        "name": "Room 1.2",
-                        "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
-                        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
-                        "holding_areas": {
-                            "holding_area 1": {
-                                "name": "HoldingArea 1.2.1",
-                                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
-                            }
-                        },
-                    },
-                },
-            },
-            "facility 2": {
-                "type": "Geological repository",
-                "name": "Facility 2",
-                "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
-                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
-                "rooms": {
-                    "room 1": {
-                        "type": "Shaft",
-                        "name": "Room 2.1",
-                        "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
-                        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
-                    },
-                    "room 2": {
-                        "type": "Drift",
-                        "name": "Room 2.2",
-                        "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
-                        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
-                        "holding_areas": {
-                            "holding_area 1": {
-                                "name": "HoldingArea 2.2.1",
-                                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
-                            }
-                        },
-                    },
-                },
-            },
-        }
+        self._build_model(_DUMMY_MODEL)
 
-        self._build_model(dummy_model)
+    def _read_model_file(self, file_path: str) -> Dict[str, Dict]:
+        """
+        Reads model data from a file in JSON format. Parsed data is
+        cached and reused as long as modification time and size of
+        the file are unchanged. Only the most recently read files are
+        kept. Cached data must not be mutated.
+
+        Args:
+            file_path (str):
+                Relative or absolute path to json file with model data.
+
+        Returns:
+            Dict[str, Dict]:
+                Dictionary containing names and structure of
+                facilities, rooms and holding areas.
+        """
+        file_stat = os.stat(file_path)
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        cache = Builder._model_file_cache
+        cached = cache.pop(file_path, None)
+        if cached is not None and cached[0] == stamp:
+            # Re-insert to mark file as most recently used
+            cache[file_path] = cached
+            return cached[1]
+
+        # Read raw bytes in one call and let the decoder handle them
+        with open(file_path, "rb") as file:
+            model = _json_loads(file.read())
+
+        # Evict least recently used files beyond the cache size
+        while len(cache) >= Builder._model_file_cache_size:
+            del cache[next(iter(cache))]
+        cache[file_path] = (stamp, model)
+        return model
 
     def load_model_from_file(self, file_path: str) -> None:
         """
@@ -2402,16 +2884,15 @@ class Builder:
                 Relative or absolute path to json file with model data.
         """
         try:
-            with open(file_path) as file:
-                model = json.load(file)
+            model = self._read_model_file(file_path)
             self._build_model(model)
             return None
         except FileNotFoundError:
-            if MonitoringSystem.get_verbosity() > 0:
+            if MonitoringSystem._verbosity > 0:
                 print(f"Error: The file '{file_path}' was not found.")
             return None
         except json.JSONDecodeError:
-            if MonitoringSystem.get_verbosity() > 0:
+            if MonitoringSystem._verbosity > 0:
                 print(f"Error: The file '{file_path}' is not a valid JSON.")
             return None
 
@@ -2432,18 +2913,33 @@ class Builder:
         else:
             model: Dict[str, Dict] = self._get_model_state_at_time(time)
 
+        # Serialize in one go and write the whole document at once
+        # instead of letting json.dump issue a write per token
+        model_json = json.dumps(model, indent=4)
+
         try:
             with open(file_path, "w") as file:
-                json.dump(model, file, indent=4)
-            if MonitoringSystem.get_verbosity() > 0:
+                file.write(model_json)
+            if MonitoringSystem._verbosity > 0:
                 print(f"Model successfully saved to {file_path}.")
         except OSError as e:
-            if MonitoringSystem.get_verbosity() > 0:
+            if MonitoringSystem._verbosity > 0:
                 print(
                     f"""An error occurred while
                     saving the model to {file_path}: {e}"""
                 )
 
+    def get_model_view(self) -> Dict[int, Facility]:
+        """
+        Gets facilities of the model for in-process access without
+        serializing the model state into a dictionary.
+
+        Returns:
+            Dict[int, Facility]:
+                Dictionary of all registered facilities, indexed by ID.
+        """
+        return MonitoringSystem.get_instance_by_type(Facility)
+
     def load_dummy_adjacency_matrix(self):
         """
         Creates dummy adjaceny matrix for dummy model data.
@@ -8,6 +8,8 @@ class Dimensions:
             _dz (float): Length in z direction.
     """
 
+    __slots__ = ("_dx", "_dy", "_dz")
+
     _dx: float
     _dy: float
     _dz: float
@@ -26,6 +28,15 @@ class Dimensions:
         """
         return f"(dx={self._dx}, dy={self._dy}, dz={self._dz})"
 
+    def __copy__(self) -> "Dimensions":
+        """
+        Creates a copy of the Dimensions instance.
+
+        Returns:
+            Dimensions: New Dimensions instance with same lengths.
+        """
+        return Dimensions(self._dx, self._dy, self._dz)
+
     def set_x(self, dx: float) -> None:
         """
         Sets length in x direction.
@@ -91,6 +102,8 @@ class Position:
         _z (float): z coordinate.
     """
 
+    __slots__ = ("_x", "_y", "_z")
+
     _x: float
     _y: float
     _z: float
@@ -137,6 +150,15 @@ class Position:
         """
         return f"(x={self._x}, y={self._y}, z={self._z})"
 
+    def __copy__(self) -> "Position":
+        """
+        Creates a copy of the Position instance.
+
+        Returns:
+            Position: New Position instance with same coordinates.
+        """
+        return Position(self._x, self._y, self._z)
+
     def set_x(self, x: float) -> None:
         """
         Sets the x coordinate.
@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../project")
+)
+
+from model.components import IDObject, MonitoringSystem  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def reset_monitoring_system():
+    """
+    Runs every test on an empty, silent registry.
+    """
+    MonitoringSystem.reset()
+    MonitoringSystem.set_verbosity(0)
+    IDObject.set_verbosity(0)
+    yield
+    MonitoringSystem.reset()
+    MonitoringSystem.set_verbosity(1)
+    IDObject.set_verbosity(1)
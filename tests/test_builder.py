@@ -0,0 +1,304 @@
+import copy
+import json
+import math
+import os
+
+import pytest
+
+from model import components
+from model.components import (
+    Builder,
+    Facility,
+    MonitoringSystem,
+    _validate_model,
+)
+
+MODEL = {
+    "time": {
+        "year": "2024",
+        "month": "01",
+        "day": "01",
+        "hour": "00",
+        "minute": "00",
+    },
+    "facility 1": {
+        "type": "Interim storage",
+        "name": "Facility 1",
+        "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
+        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+        "rooms": {
+            "room 1": {
+                "type": "Storage",
+                "name": "Room 1.1",
+                "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
+                "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+                "holding_areas": {
+                    "holding_area 1": {
+                        "name": "HoldingArea 1.1.1",
+                        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+                        "container": {
+                            "type": "Castor",
+                            "name": "Container 1",
+                            "dimensions": {"dx": 1.0, "dy": 1.0, "dz": 1.0},
+                        },
+                    }
+                },
+            }
+        },
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_model_file_cache():
+    """
+    Runs every test on an empty model file cache.
+    """
+    Builder._model_file_cache.clear()
+    yield
+    Builder._model_file_cache.clear()
+
+
+def _write_model(path, model=MODEL):
+    with open(path, "w") as file:
+        json.dump(model, file)
+    return str(path)
+
+
+def test_load_model_from_file(tmp_path):
+    """
+    Test that a model file is built into registered facilities.
+    """
+    Builder().load_model_from_file(_write_model(tmp_path / "model.json"))
+    facilities = MonitoringSystem.get_instance_by_type(Facility)
+    assert [f.get_name() for f in facilities.values()] == ["Facility 1"]
+
+
+def test_read_model_file_reuses_cache(tmp_path):
+    """
+    Test that an unchanged file is parsed only once.
+    """
+    path = _write_model(tmp_path / "model.json")
+    builder = Builder()
+    assert builder._read_model_file(path) is builder._read_model_file(path)
+
+
+def test_read_model_file_invalidated_by_size(tmp_path):
+    """
+    Test that the cache is invalidated when the file size changes.
+    """
+    path = _write_model(tmp_path / "model.json")
+    builder = Builder()
+    first = builder._read_model_file(path)
+    stat = os.stat(path)
+
+    model = json.loads(json.dumps(MODEL))
+    model["facility 1"]["name"] = "Facility 1 renamed"
+    _write_model(path, model)
+    # Keep modification time so that only the size differs
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    second = builder._read_model_file(path)
+    assert second is not first
+    assert second["facility 1"]["name"] == "Facility 1 renamed"
+
+
+def test_read_model_file_invalidated_by_mtime(tmp_path):
+    """
+    Test that the cache is invalidated when the modification time
+    changes while the size stays the same.
+    """
+    path = _write_model(tmp_path / "model.json")
+    builder = Builder()
+    first = builder._read_model_file(path)
+    stat = os.stat(path)
+
+    model = json.loads(json.dumps(MODEL))
+    model["facility 1"]["name"] = "Facility X"
+    _write_model(path, model)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert os.stat(path).st_size == stat.st_size
+
+    second = builder._read_model_file(path)
+    assert second is not first
+    assert second["facility 1"]["name"] == "Facility X"
+
+
+def test_read_model_file_cache_is_bounded(tmp_path):
+    """
+    Test that only the most recently read files are cached.
+    """
+    builder = Builder()
+    size = Builder._model_file_cache_size
+    paths = [
+        _write_model(tmp_path / f"model_{i}.json") for i in range(size + 1)
+    ]
+    for path in paths:
+        builder._read_model_file(path)
+
+    assert len(Builder._model_file_cache) == size
+    assert paths[0] not in Builder._model_file_cache
+
+    # Reading a cached file again protects it from the next eviction
+    builder._read_model_file(paths[1])
+    builder._read_model_file(paths[0])
+    assert paths[1] in Builder._model_file_cache
+    assert paths[2] not in Builder._model_file_cache
+
+
+def _holding_area(model):
+    return model["facility 1"]["rooms"]["room 1"]["holding_areas"][
+        "holding_area 1"
+    ]
+
+
+def test_validate_model_accepts_dummy_models():
+    """
+    Test that valid models pass validation.
+    """
+    _validate_model(MODEL)
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
+    with open(os.path.join(data_dir, "dummy_model.json")) as file:
+        _validate_model(json.load(file))
+
+
+@pytest.mark.parametrize(
+    "model",
+    [{}, [], {"time": MODEL["time"]}],
+)
+def test_validate_model_requires_facility(model):
+    """
+    Test that models without facility are rejected.
+    """
+    with pytest.raises(KeyError, match="at least a time stamp"):
+        _validate_model(model)
+
+
+def test_validate_model_missing_keys():
+    """
+    Test that missing keys are reported with the path to the entry.
+    """
+    model = copy.deepcopy(MODEL)
+    del model["time"]["minute"]
+    with pytest.raises(KeyError, match="Time stamp must contain 'minute'"):
+        _validate_model(model)
+
+    model = copy.deepcopy(MODEL)
+    del model["facility 1"]["rooms"]["room 1"]["position"]["y"]
+    with pytest.raises(
+        KeyError,
+        match="Position of room 'room 1' of facility 'facility 1' "
+        "must contain 'y'",
+    ):
+        _validate_model(model)
+
+    model = copy.deepcopy(MODEL)
+    del _holding_area(model)["container"]["dimensions"]["dz"]
+    with pytest.raises(
+        KeyError,
+        match="Dimensions of container of holding area 'holding_area 1' "
+        "of room 'room 1' of facility 'facility 1' must contain 'dz'",
+    ):
+        _validate_model(model)
+
+
+def test_validate_model_keeps_case_of_keys():
+    """
+    Test that user keys and names are reported as written.
+    """
+    model = copy.deepcopy(MODEL)
+    room = model["facility 1"]["rooms"]["room 1"]
+    room["holding_areas"] = {"HA_X": room["holding_areas"]["holding_area 1"]}
+    del room["holding_areas"]["HA_X"]["container"]["name"]
+    with pytest.raises(
+        KeyError, match="Container of holding area 'HA_X' of room 'room 1'"
+    ):
+        _validate_model(model)
+
+
+@pytest.mark.parametrize(
+    "path, value, message",
+    [
+        (("facility 1", "rooms"), [], "Rooms of facility 'facility 1'"),
+        (("facility 1", "rooms"), "room 1", "Rooms of facility 'facility 1'"),
+        (
+            ("facility 1", "rooms", "room 1", "holding_areas"),
+            ["holding_area 1"],
+            "Holding areas of room 'room 1' of facility 'facility 1'",
+        ),
+        (
+            ("facility 1", "rooms", "room 1", "holding_areas"),
+            "holding_area 1",
+            "Holding areas of room 'room 1' of facility 'facility 1'",
+        ),
+        (
+            ("facility 1", "dimensions"),
+            [1.0, 1.0, 1.0],
+            "Dimensions of facility 'facility 1'",
+        ),
+    ],
+)
+def test_validate_model_rejects_non_dictionaries(path, value, message):
+    """
+    Test that collections of wrong type raise KeyError.
+    """
+    model = copy.deepcopy(MODEL)
+    stats = model
+    for key in path[:-1]:
+        stats = stats[key]
+    stats[path[-1]] = value
+    with pytest.raises(KeyError, match=f"{message} must be a dictionary"):
+        _validate_model(model)
+
+
+def test_validate_model_requires_room():
+    """
+    Test that facilities without rooms are rejected.
+    """
+    model = copy.deepcopy(MODEL)
+    model["facility 1"]["rooms"] = {}
+    with pytest.raises(KeyError, match="at least one room"):
+        _validate_model(model)
+
+
+def test_invalid_model_registers_no_instances():
+    """
+    Test that an invalid model leaves the registry empty.
+    """
+    model = copy.deepcopy(MODEL)
+    del _holding_area(model)["container"]["type"]
+    with pytest.raises(KeyError):
+        Builder()._build_model(model)
+    assert not MonitoringSystem._registry
+
+
+def test_json_loads_accepts_non_finite_numbers():
+    """
+    Test that NaN and Infinity load like with the json module.
+    """
+    data = b'{"dx": NaN, "dy": Infinity, "dz": 1.0}'
+    values = components._json_loads(data)
+    assert math.isnan(values["dx"])
+    assert values["dy"] == math.inf
+
+
+def test_json_loads_falls_back_to_json(monkeypatch):
+    """
+    Test that data rejected by the fast decoder is decoded with json.
+    """
+
+    def reject(data):
+        raise json.JSONDecodeError("rejected", "", 0)
+
+    monkeypatch.setattr(components, "_orjson_loads", reject)
+    assert math.isnan(components._json_loads(b'{"dx": NaN}')["dx"])
+    with pytest.raises(json.JSONDecodeError):
+        components._json_loads(b"{")
+
+
+def test_json_loads_without_orjson(monkeypatch):
+    """
+    Test decoding with the json module only.
+    """
+    monkeypatch.setattr(components, "_orjson_loads", None)
+    assert components._json_loads(b'{"x": 1}') == {"x": 1}
@@ -0,0 +1,200 @@
+import os
+
+import pytest
+
+from model.components import (
+    Builder,
+    Commander,
+    Container,
+    HoldingArea,
+    MonitoringSystem,
+    TransportCmd,
+)
+
+MODEL_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "data", "dummy_model.json"
+)
+
+
+@pytest.fixture
+def builder():
+    """
+    Builds the dummy model from its data file.
+    """
+    builder = Builder()
+    builder.load_model_from_file(MODEL_FILE)
+    return builder
+
+
+def _get_by_name(class_type, name):
+    for instance in MonitoringSystem.get_instance_by_type(class_type).values():
+        if instance.get_name() == name:
+            return instance
+    raise KeyError(name)
+
+
+def _move(container, holding_area, start_time, end_time):
+    origin = container.get_location()
+    destination = holding_area.get_location()
+    destination.set_holding_area(holding_area)
+    Commander().issue_transport_command(
+        container, origin, destination, start_time, end_time
+    )
+    return origin, destination
+
+
+def _container_positions(model):
+    """
+    Gets names of holding areas and their containers in a model state.
+    """
+    positions = {}
+    for key, facility_stats in model.items():
+        if key == "time":
+            continue
+        for room_stats in facility_stats["rooms"].values():
+            holding_areas = room_stats.get("holding_areas", {})
+            for holding_area_stats in holding_areas.values():
+                if "container" in holding_area_stats:
+                    positions[holding_area_stats["name"]] = holding_area_stats[
+                        "container"
+                    ]["name"]
+    return positions
+
+
+def test_transport_moves_container(builder):
+    """
+    Test location, occupation and histories after a transport.
+    """
+    container = _get_by_name(Container, "Container 1")
+    origin_area = _get_by_name(HoldingArea, "HoldingArea 1.1.1")
+    destination_area = _get_by_name(HoldingArea, "HoldingArea 2.2.1")
+    assert origin_area.get_occupation_status()
+    assert not destination_area.get_occupation_status()
+
+    _move(container, destination_area, "2024:04:04.09:42", "2024:04:04.11:08")
+
+    location = container.get_location()
+    assert location.get_holding_area() is destination_area
+    assert location.get_facility().get_name() == "Facility 2"
+    assert not origin_area.get_occupation_status()
+    assert destination_area.get_occupation_status()
+
+    (entry,) = container.get_instance_history().get_entries().values()
+    assert entry.cmd_type == "transport"
+    assert entry.changed_value == "Location"
+    assert entry.old_value.get_holding_area() is origin_area
+    assert entry.new_value.get_holding_area() is destination_area
+
+    id = container.get_id()
+    for holding_area, old, new in (
+        (origin_area, {id: container}, {}),
+        (destination_area, {}, {id: container}),
+    ):
+        inventory, occupation = (
+            holding_area.get_instance_history().get_entries().values()
+        )
+        assert inventory.changed_value == "container_inventory"
+        assert (inventory.old_value, inventory.new_value) == (old, new)
+        assert occupation.changed_value == "occupation_status"
+        assert (occupation.old_value, occupation.new_value) == (
+            bool(old),
+            bool(new),
+        )
+
+
+def test_transport_back_restores_occupation(builder):
+    """
+    Test that moving a container back restores both holding areas.
+    """
+    container = _get_by_name(Container, "Container 1")
+    origin_area = _get_by_name(HoldingArea, "HoldingArea 1.1.1")
+    destination_area = _get_by_name(HoldingArea, "HoldingArea 2.2.1")
+
+    _move(container, destination_area, "2024:04:04.09:42", "2024:04:04.11:08")
+    _move(container, origin_area, "2024:08:06.13:12", "2024:08:06.14:19")
+
+    assert container.get_location().get_holding_area() is origin_area
+    assert origin_area.get_occupation_status()
+    assert not destination_area.get_occupation_status()
+    assert len(container.get_instance_history().get_entries()) == 2
+    assert len(origin_area.get_instance_history().get_entries()) == 4
+
+
+def test_transport_from_stale_origin(builder):
+    """
+    Test that a transport from an outdated origin is rejected
+    without changing the model.
+    """
+    container = _get_by_name(Container, "Container 1")
+    origin_area = _get_by_name(HoldingArea, "HoldingArea 1.1.2")
+    destination_area = _get_by_name(HoldingArea, "HoldingArea 2.2.1")
+
+    origin, _ = _move(
+        container, destination_area, "2024:04:04.09:42", "2024:04:04.11:08"
+    )
+    destination = origin_area.get_location()
+    destination.set_holding_area(origin_area)
+
+    with pytest.raises(KeyError):
+        Commander().issue_transport_command(
+            container,
+            origin,
+            destination,
+            "2024:08:06.13:12",
+            "2024:08:06.14:19",
+        )
+    assert container.get_location().get_holding_area() is destination_area
+    assert not origin_area.get_occupation_status()
+    assert len(container.get_instance_history().get_entries()) == 1
+
+
+def test_activation_requires_commander(builder):
+    """
+    Test that activation without Commander's token is refused.
+    """
+    container = _get_by_name(Container, "Container 1")
+    destination_area = _get_by_name(HoldingArea, "HoldingArea 2.2.1")
+    destination = destination_area.get_location()
+    destination.set_holding_area(destination_area)
+    cmd = TransportCmd(
+        container,
+        container.get_location(),
+        destination,
+        "2024:04:04.09:42",
+        "2024:04:04.11:08",
+    )
+
+    for component in (destination_area, container):
+        with pytest.raises(PermissionError):
+            component.activation(cmd, object())
+    assert container.get_instance_history().get_entries() == {}
+    assert not destination_area.get_occupation_status()
+
+
+def test_model_state_between_transports(builder):
+    """
+    Test container placement in model states before, between
+    and after two transports.
+    """
+    container = _get_by_name(Container, "Container 1")
+    origin_area = _get_by_name(HoldingArea, "HoldingArea 1.1.1")
+    destination_area = _get_by_name(HoldingArea, "HoldingArea 2.2.1")
+
+    _move(container, destination_area, "2024:04:04.09:42", "2024:04:04.11:08")
+    between = _container_positions(
+        builder._get_model_state_at_time("2024:05:01.00:00")
+    )
+    assert between == {"HoldingArea 2.2.1": "Container 1"}
+    before = _container_positions(
+        builder._get_model_state_at_time("2024:04:01.00:00")
+    )
+    assert before == {"HoldingArea 1.1.1": "Container 1"}
+
+    _move(container, origin_area, "2024:08:06.13:12", "2024:08:06.14:19")
+    between = _container_positions(
+        builder._get_model_state_at_time("2024:05:01.00:00")
+    )
+    assert between == {"HoldingArea 2.2.1": "Container 1"}
+    assert _container_positions(builder._get_current_model_state()) == {
+        "HoldingArea 1.1.1": "Container 1"
+    }
@@ -0,0 +1,59 @@
+import pytest
+
+from model.components import Facility, HoldingArea, Room
+from model.units import Dimensions, Position
+
+
+def _facility():
+    return Facility(
+        "Interim storage", "Facility 1", Dimensions(1, 1, 1), Position()
+    )
+
+
+def _room():
+    return Room("Storage", "Room 1.1", Dimensions(1, 1, 1), Position())
+
+
+def test_room_inventory_is_read_only_view():
+    """
+    Test that the room inventory cannot be changed through its view
+    and that the view shows rooms added later.
+    """
+    facility = _facility()
+    inventory = facility.get_room_inventory()
+    assert dict(inventory) == {}
+
+    room = _room()
+    facility.add_room(room)
+    assert dict(inventory) == {room.get_id(): room}
+    with pytest.raises(TypeError):
+        inventory[room.get_id() + 1] = room
+    with pytest.raises(TypeError):
+        del inventory[room.get_id()]
+
+    # Removing while iterating requires a copy of the view
+    for room_id in list(facility.get_room_inventory()):
+        facility.remove_room(room_id)
+    assert dict(inventory) == {}
+
+
+def test_holding_area_inventory_is_read_only_view():
+    """
+    Test that the holding area inventory cannot be changed through
+    its view and that the view shows holding areas added later.
+    """
+    facility = _facility()
+    room = _room()
+    facility.add_room(room)
+    inventory = room.get_holding_area_inventory()
+    assert dict(inventory) == {}
+
+    holding_area = HoldingArea("HoldingArea 1.1.1", Position())
+    room.add_holding_area(holding_area)
+    assert dict(inventory) == {holding_area.get_id(): holding_area}
+    with pytest.raises(TypeError):
+        inventory[holding_area.get_id() + 1] = holding_area
+
+    for holding_area_id in list(room.get_holding_area_inventory()):
+        room.remove_holding_area(holding_area_id)
+    assert dict(inventory) == {}
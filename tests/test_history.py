@@ -0,0 +1,185 @@
+from datetime import datetime
+
+import pytest
+
+from model.components import History, HistoryEntry
+
+FORMAT = "%Y:%m:%d.%H:%M"
+
+# Entries added out of end time order to exercise the end time index
+ENTRIES = {
+    1: HistoryEntry(
+        1, "Transport", None, "2024:01:01.11:00", "2024:01:01.12:00"
+    ),
+    2: HistoryEntry(
+        2, "Transport", None, "2024:01:01.09:00", "2024:01:01.10:00"
+    ),
+    3: HistoryEntry(
+        3, "Transport", None, "2024:01:01.10:00", "2024:01:01.11:00"
+    ),
+    4: HistoryEntry(
+        4, "Transport", None, "2024:01:01.09:30", "2024:01:01.10:00"
+    ),
+}
+
+# Times at, just before and just after every start and end time
+TIMES = [
+    "2024:01:01.08:59",
+    "2024:01:01.09:00",
+    "2024:01:01.09:01",
+    "2024:01:01.09:29",
+    "2024:01:01.09:30",
+    "2024:01:01.09:31",
+    "2024:01:01.09:59",
+    "2024:01:01.10:00",
+    "2024:01:01.10:01",
+    "2024:01:01.10:59",
+    "2024:01:01.11:00",
+    "2024:01:01.11:01",
+    "2024:01:01.11:59",
+    "2024:01:01.12:00",
+    "2024:01:01.12:01",
+]
+
+
+def _history():
+    history = History()
+    history.set_entries(dict(ENTRIES))
+    return history
+
+
+def _linear_at_time(time):
+    """
+    Reference filter: entries that ended strictly before time.
+    """
+    time_dt = datetime.strptime(time, FORMAT)
+    return {
+        no
+        for no, entry in ENTRIES.items()
+        if datetime.strptime(entry.end_time, FORMAT) < time_dt
+    }
+
+
+def _linear_ongoing_at_time(time):
+    """
+    Reference filter: entries started strictly before and ending
+    strictly after time.
+    """
+    time_dt = datetime.strptime(time, FORMAT)
+    return {
+        entry.cmd_id
+        for entry in ENTRIES.values()
+        if datetime.strptime(entry.start_time, FORMAT)
+        < time_dt
+        < datetime.strptime(entry.end_time, FORMAT)
+    }
+
+
+@pytest.mark.parametrize("time", TIMES)
+def test_at_time_matches_linear_filter(time):
+    """
+    Test that bisected at_time matches a linear filter at boundaries.
+    """
+    assert set(_history().at_time(time).get_entries()) == _linear_at_time(time)
+
+
+def test_at_time_excludes_entries_ending_at_time():
+    """
+    Test that entries ending exactly at the target time are excluded.
+    """
+    history = _history()
+    assert set(history.at_time("2024:01:01.10:00").get_entries()) == set()
+    assert set(history.at_time("2024:01:01.10:01").get_entries()) == {2, 4}
+
+
+def test_at_times_matches_at_time():
+    """
+    Test that at_times returns slices in the order of given times.
+    """
+    history = _history()
+    times = list(reversed(TIMES)) + TIMES[::2]
+    for time, history_at_time in zip(times, history.at_times(times)):
+        assert (
+            history_at_time.get_entries()
+            == history.at_time(time).get_entries()
+        )
+
+
+@pytest.mark.parametrize("time", TIMES)
+def test_ongoing_at_time_matches_linear_filter(time):
+    """
+    Test that bisected ongoing_at_time matches a linear filter.
+    """
+    ongoing = _history().ongoing_at_time(time).get_entries()
+    assert {entry.cmd_id for entry in ongoing.values()} == (
+        _linear_ongoing_at_time(time)
+    )
+
+
+def test_ongoing_at_time_excludes_start_and_end():
+    """
+    Test that commands are not ongoing at their exact start or end time.
+    """
+    history = _history()
+    assert history.ongoing_at_time("2024:01:01.10:00").get_entries() == {}
+    ongoing = history.ongoing_at_time("2024:01:01.10:01").get_entries()
+    assert [entry.cmd_id for entry in ongoing.values()] == [3]
+
+
+def test_end_time_index_reset_on_change():
+    """
+    Test that the end time index is rebuilt after entries change.
+    """
+    history = _history()
+    assert set(history.at_time("2024:01:01.12:01").get_entries()) == {
+        1,
+        2,
+        3,
+        4,
+    }
+    history.delete_entries(1)
+    assert set(history.at_time("2024:01:01.12:01").get_entries()) == {
+        2,
+        3,
+        4,
+    }
+
+
+def test_set_entries_replaces_field():
+    """
+    Test that a field of an immutable entry is set by replacement.
+    """
+    history = _history()
+    source = object()
+    history.set_entries(source, 2, "source")
+    assert history.get_entries()[2].source is source
+    assert history.get_entries()[2] == ENTRIES[2]._replace(source=source)
+    assert ENTRIES[2].source is None
+
+
+@pytest.mark.parametrize("keys", [(9, "source"), (2, "unknown"), (2,) * 3])
+def test_set_entries_invalid_key_path(keys):
+    """
+    Test that unknown entries, fields and key paths raise KeyError.
+    """
+    history = _history()
+    with pytest.raises(KeyError):
+        history.set_entries(None, *keys)
+    assert history.get_entries() == ENTRIES
+
+
+def test_delete_entries():
+    """
+    Test that entries are deleted and optional fields are reset.
+    """
+    history = _history()
+    history.set_entries("Location", 2, "changed_value")
+    history.delete_entries(2, "changed_value")
+    assert history.get_entries()[2] == ENTRIES[2]
+
+    history.delete_entries(2)
+    assert 2 not in history.get_entries()
+    with pytest.raises(KeyError):
+        history.delete_entries(2)
+    with pytest.raises(KeyError):
+        history.delete_entries(1, "end_time")
@@ -0,0 +1,62 @@
+import pytest
+
+from model.components import (
+    Builder,
+    Container,
+    HistoryObject,
+    IDObject,
+    InstanceNotFoundError,
+    MonitoringSystem,
+)
+
+
+def test_get_instance_by_type_includes_base_classes():
+    """
+    Test that instances are found by their class and all base classes.
+    """
+    Builder().load_dummy_model()
+    containers = MonitoringSystem.get_instance_by_type(Container)
+    assert containers
+
+    all_instances = MonitoringSystem.get_instance_by_type(object)
+    assert len(all_instances) == len(MonitoringSystem._registry)
+    assert MonitoringSystem.get_instance_by_type(IDObject) == all_instances
+    for id, container in containers.items():
+        assert MonitoringSystem.get_instance_by_type(HistoryObject)[id] is (
+            container
+        )
+        assert all_instances[id] is container
+
+
+def test_get_instance_by_id():
+    """
+    Test that instances are retrieved by their ID.
+    """
+    Builder().load_dummy_model()
+    for id, instance in enumerate(MonitoringSystem._registry):
+        assert MonitoringSystem.get_instance(id) is instance
+    # IDs comparing equal to an integer are accepted like dictionary keys
+    assert MonitoringSystem.get_instance(3.0) is (
+        MonitoringSystem.get_instance(3)
+    )
+
+
+@pytest.mark.parametrize(
+    "id", [10**6, -1, "3", 3.5, None, float("nan"), float("inf")]
+)
+def test_get_instance_not_found(id):
+    """
+    Test that unknown, negative and wrong-type IDs raise
+    InstanceNotFoundError.
+    """
+    Builder().load_dummy_model()
+    with pytest.raises(InstanceNotFoundError):
+        MonitoringSystem.get_instance(id)
+
+
+def test_get_instance_empty_registry():
+    """
+    Test that lookups in an empty registry raise InstanceNotFoundError.
+    """
+    with pytest.raises(InstanceNotFoundError):
+        MonitoringSystem.get_instance(0)
@@ -0,0 +1,33 @@
+from datetime import datetime
+
+import pytest
+
+from model.components import _parse_time
+
+
+def test_parse_time_padded():
+    """
+    Test parsing of zero-padded time stamps.
+    """
+    assert _parse_time("2024:04:04.09:42") == datetime(2024, 4, 4, 9, 42)
+
+
+def test_parse_time_unpadded():
+    """
+    Test that unpadded fields are accepted like strptime does.
+    """
+    assert _parse_time("2024:4:4.9:42") == datetime(2024, 4, 4, 9, 42)
+    assert _parse_time("2024:4:4.9:42") == datetime.strptime(
+        "2024:4:4.9:42", "%Y:%m:%d.%H:%M"
+    )
+
+
+@pytest.mark.parametrize(
+    "time", ["2024-04-04 09:42", "2024:04:04.09:42:00", "2024:13:01.00:00"]
+)
+def test_parse_time_invalid(time):
+    """
+    Test that malformed time stamps raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        _parse_time(time)